@@ -34,14 +34,17 @@
 # FROM, OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER
 # DEALINGS IN THE SOFTWARE.
 
-from dataclasses import dataclass
-from itertools import islice
+from functools import lru_cache
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from matplotlib.figure import Figure
+from operator import itemgetter
 from random import randrange
+from types import MappingProxyType
+import concurrent.futures
 import idlelib.colorizer as colorizer
 import idlelib.percolator as percolator
 import matplotlib
+import numpy
 import re
 import sqlite3
 import subprocess
@@ -61,6 +64,10 @@ NONE_STRING = '-/-'
 ELEMENT_CLASSES = [NONE_STRING, 'Nature', 'Air', 'Water', 'Light', 'Energy',
                    'Psi', 'Stone', 'Ice', 'Fire', 'Dark', 'Chaos', 'Metal',
                    '✱']  # See makeStringSearchable()
+ELEMENT_CLASS_TO_INDEX = {
+    name: index for index, name in enumerate(ELEMENT_CLASSES)
+}
+ELEMENT_CLASS_BY_INDEX = dict(enumerate(ELEMENT_CLASSES))
 MANA_LEVELS = [5, 15, 30, 40, 55, NONE_STRING]
 FAIRY_GLOWS_WITH_INTENSITY = [
     (NONE_STRING, 0),
@@ -103,6 +110,8 @@ FAIRY_GLOWS_WITH_INTENSITY = [
     ('Blue with purple particles', 1),
     ('Grey dust', 1),
 ]
+FAIRY_GLOW_TEXT_BY_INDEX = \
+    dict(enumerate(text for text, _ in FAIRY_GLOWS_WITH_INTENSITY))
 ACTIVE_SPELL_CRIT_EFFECTS = [
     # Derived, modified and corrected from
     # https://github.com/Helco/zzdocs/blob/9be46e8300fff4666832d5381690a4c6f1deac3c/docs/resources/FBS/fb0x03.md#behavior
@@ -207,8 +216,15 @@ PASSIVE_SPELL_EFFECTS = [
     "Can't be burned",
     'Prevents status changes',
 ]
+ACTIVE_SPELL_CRIT_EFFECT_BY_INDEX = \
+    dict(enumerate(ACTIVE_SPELL_CRIT_EFFECTS))
+PASSIVE_SPELL_EFFECT_BY_INDEX = dict(enumerate(PASSIVE_SPELL_EFFECTS))
+SPELL_EFFECT_COMBOBOX_WIDTH = \
+    max(map(len, ACTIVE_SPELL_CRIT_EFFECTS + PASSIVE_SPELL_EFFECTS))
 MAX_LEVEL = 60  # See other hard-coded instances of 60
 MAX_EXPERIENCE = 15000
+EXPERIENCE_CURVE_LEVELS = numpy.arange(0, MAX_LEVEL + 1,
+                                       dtype=numpy.float64)
 
 
 def splitByWhitespace(string):
@@ -216,7 +232,7 @@ def splitByWhitespace(string):
     Splits the given string by whitespaces and returns every non-empty
     substring.
     """
-    return list(filter(None, string.split(' ')))
+    return string.split()
 
 
 def extractUid(string):
@@ -226,29 +242,73 @@ def extractUid(string):
     return string.split('(')[1].split(')')[0]
 
 
+@lru_cache(maxsize=4096)
+def toRawIntString(uid_string):
+    """
+    'E12F912' -> '236583186'. Memoized so the same UID only gets
+    parsed once.
+    """
+    return str(int(uid_string, 16))
+
+
+@lru_cache(maxsize=None)
+def getSharedCursor(sql_connection):
+    """
+    Returns a reusable cursor for one-shot queries which consume their
+    result before returning.
+    """
+    return sql_connection.cursor()
+
+
 def fetchString(sql_connection, query_string, params):
-    sql_cursor = sql_connection.cursor()
+    sql_cursor = getSharedCursor(sql_connection)
     sql_cursor.execute(query_string, params)
     return sql_cursor.fetchone()
 
 
-def fetchStringOrNull(sql_connection, query_string, params):
-    result = fetchString(sql_connection, query_string, params)
-    if result is None:
-        return 'NULL'
-    return result[0]
+@lru_cache(maxsize=None)
+def buildStringIndex(sql_connection, table_name):
+    """
+    Load all strings in the given table at once and map UID -> string.
+    This batches the countless per-UID lookups during script
+    decompilation into a single query per connection.
+    """
+    sql_cursor = sql_connection.cursor()
+    sql_cursor.execute('select UID, col_0_String from ' + table_name)
+    return dict(sql_cursor)
 
 
 def resolveLabel(sql_connection, uid):
-    return fetchStringOrNull(sql_connection,
-                             'select col_0_String from _fb0x02 where UID =?',
-                             (uid,))
+    return buildStringIndex(sql_connection, '_fb0x02').get(uid, 'NULL')
 
 
 def resolveDialog(sql_connection, uid):
-    return fetchStringOrNull(sql_connection,
-                             'select col_0_String from _fb0x06 where UID =?',
-                             (uid,))
+    return buildStringIndex(sql_connection, '_fb0x06').get(uid, 'NULL')
+
+
+@lru_cache(maxsize=None)
+def buildDeletableStringIndex(sql_connection):
+    """
+    Collect the UIDs of all strings the editor allows deleting: NPC
+    names and spell infos.
+    """
+    sql_cursor = sql_connection.cursor()
+    sql_cursor.execute(
+        'select UID from _fb0x02 where col_1_Integer in (5, 10)')
+    return frozenset(uid for uid, in sql_cursor)
+
+
+def clearResolverCaches():
+    """
+    Invalidate all memoized database lookups. Must be called after every
+    write to the database.
+    """
+    buildStringIndex.cache_clear()
+    buildDeletableStringIndex.cache_clear()
+    buildCardIndex.cache_clear()
+    buildFairyNameList.cache_clear()
+    getFairyListComboboxWidth.cache_clear()
+    decompile.cache_clear()
 
 
 def resolveMana(id):
@@ -259,20 +319,11 @@ def resolveMana(id):
     return str(MANA_LEVELS[id])
 
 
-def fetchAllNpcScripts(sql_connection, npc_uid):
-    sql_cursor = sql_connection.cursor()
-    sql_cursor.execute("""select col_2_String, col_3_String, col_1_String,
-    col_5_String, col_4_String from _fb0x05 where UID =?""", (npc_uid,))
-    result = sql_cursor.fetchall()
-    if result is None:
-        return None
-    return {
-        'Init':       str(result[0][0]),
-        'Update':     str(result[0][1]),
-        'Trigger':    str(result[0][2]),
-        'Victorious': str(result[0][3]),
-        'Defeated':   str(result[0][4]),
-    }
+# The script columns plus the name foreign key, for loading an NPC
+# into the editor with a single round-trip.
+NPC_DETAILS_QUERY = \
+    'select col_0_ForeignKey, col_2_String, col_3_String, ' + \
+    'col_1_String, col_5_String, col_4_String from _fb0x05 where UID =?'
 
 
 def getCardEntityId(card_id):
@@ -280,59 +331,165 @@ def getCardEntityId(card_id):
     return (card_id >> 16) & 0xffff
 
 
-def resolveCardIdName(sql_connection, query_string, entity_id):
-    entity_id = str(entity_id)
-
+@lru_cache(maxsize=None)
+def buildCardIndex(sql_connection, query_string):
+    """
+    Takes a query which returns a list of pairs: [name_uid, card_id].
+    Returns a dictionary mapping entity ids to name UIDs.
+    """
     sql_cursor = sql_connection.cursor()
     sql_cursor.execute(query_string)
-    card_values = sql_cursor.fetchall()
-    for name_id, card_id in card_values:
-        if str(getCardEntityId(card_id)) == entity_id:
-            return resolveLabel(sql_connection, name_id.split('|')[0])
-    return 'NULL'
+    return {
+        str(getCardEntityId(card_id)): name_id.partition('|')[0]
+        for name_id, card_id in sql_cursor
+    }
+
+
+def resolveCardIdName(sql_connection, query_string, entity_id):
+    card_index = buildCardIndex(sql_connection, query_string)
+    name_uid = card_index.get(str(entity_id))
+    if name_uid is None:
+        return 'NULL'
+    return resolveLabel(sql_connection, name_uid)
+
+
+FAIRY_CARD_QUERY = 'select col_1_ForeignKey, col_3_Integer from _fb0x01'
+
+
+def buildSuffixStripSQL(column):
+    """
+    Returns a SQL expression which strips the '|'-separated suffix
+    foreign keys carry, so they can be joined against _fb0x02.UID.
+    """
+    return f"""case
+        when instr({column}, '|') = 0 then {column}
+        else substr({column}, 1, instr({column}, '|') - 1)
+    end"""
+
+
+# Resolves each fairy's name in the same statement.
+FAIRY_NAME_LIST_QUERY = f"""select f.col_3_Integer,
+    ifnull(s.col_0_String, 'NULL') from _fb0x01 f
+    left join _fb0x02 s
+        on s.UID = {buildSuffixStripSQL('f.col_1_ForeignKey')}"""
+SPELL_CARD_QUERY = 'select col_0_ForeignKey, col_2_Integer from _fb0x03'
+ITEM_CARD_QUERY = 'select col_0_ForeignKey, col_1_Integer from _fb0x04'
+
+# Kept textually stable so sqlite reuses the prepared statements from
+# its per-connection cache.
+FAIRY_DETAILS_QUERY = """select
+    col_0_String, col_2_Integer, col_5_Integer, col_6_Integer,
+    col_7_Integer, col_8_Integer, col_9_Integer, col_10_Integer,
+    col_11_Integer, col_12_Integer, col_13_Integer, col_14_Integer,
+    col_16_Integer, col_17_Integer, col_18_Integer, col_19_Integer,
+    col_20_Integer, col_21_Integer, col_23_Integer, col_25_Integer
+    from _fb0x01 where UID = ?"""
+FAIRY_UPDATE_QUERY = """update _fb0x01 set
+    col_0_String = :model, col_2_Integer = :element_class,
+    col_5_Integer = :slot_0, col_6_Integer = :slot_1,
+    col_7_Integer = :slot_2, col_8_Integer = :slot_3,
+    col_9_Integer = :slot_4, col_10_Integer = :slot_5,
+    col_11_Integer = :slot_6, col_12_Integer = :slot_7,
+    col_13_Integer = :slot_8, col_14_Integer = :slot_9,
+    col_16_Integer = :hp_limit, col_17_Integer = :evolution_fairy_id,
+    col_18_Integer = :evolution_level, col_19_Integer = :move_speed,
+    col_20_Integer = :jump_ability, col_21_Integer = :special,
+    col_23_Integer = :glow_id, col_25_Integer = :exp_coefficient
+    where UID = :uid"""
+SPELL_DETAILS_QUERY = """select col_1_Integer, col_3_Byte, col_4_Byte,
+    col_5_Byte, col_6_ForeignKey, col_7_Integer, col_8_Integer,
+    col_10_Integer, col_11_Integer, col_12_Integer, col_13_Integer
+    from _fb0x03 where UID = ?"""
+SPELL_UPDATE_QUERY = """update _fb0x03 set
+    col_1_Integer=?, col_3_Byte=?, col_4_Byte=?, col_5_Byte=?,
+    col_6_ForeignKey=?, col_7_Integer=?, col_8_Integer=?, col_10_Integer=?,
+    col_11_Integer=?, col_12_Integer=?, col_13_Integer=?
+    where UID = ?"""
+ITEM_SCRIPT_QUERY = """select UID, col_4_String from _fb0x04
+    where (col_1_Integer >> 16) & 65535 = ?"""
+ITEM_UPDATE_QUERY = 'update _fb0x04 set col_4_String = ? where UID = ?'
+NPC_UPDATE_QUERY = """update _fb0x05 set
+    col_0_ForeignKey = ?,
+    col_2_String = ?,
+    col_3_String = ?,
+    col_1_String = ?,
+    col_5_String = ?,
+    col_4_String = ?
+    where UID = ?"""
 
 
 def resolveFairyName(sql_connection, fairy_id):
-    query_string = 'select col_1_ForeignKey, col_3_Integer from _fb0x01'
-    return resolveCardIdName(sql_connection, query_string, fairy_id)
+    return resolveCardIdName(sql_connection, FAIRY_CARD_QUERY, fairy_id)
 
 
-def resolveUid(sql_connection, query, entity_id):
+@lru_cache(maxsize=None)
+def buildFairyNameList(sql_connection):
     """
-    Takes a query which returns a list of pairs: [uid, card_id]. Returns None
-    if no matching card id was found.
+    Returns a pair: a sorted list of fairy descriptions prefixed with
+    -/- for use in comboboxes, and a mapping from fairy ids to their
+    descriptions.
     """
     sql_cursor = sql_connection.cursor()
-    sql_cursor.execute(query)
-    for uid, card_id in sql_cursor.fetchall():
-        if str(getCardEntityId(card_id)) == entity_id:
-            return uid
-    return None
+    sql_cursor.execute(FAIRY_NAME_LIST_QUERY)
+
+    fairy_name_pairs = []
+    fairy_descriptions = {}
+    for card_id, name in sql_cursor:
+        fairy_id = getCardEntityId(card_id)
+        description = 'Fairy(' + str(fairy_id) + ') ' + name
+        fairy_name_pairs.append((name, description))
+        fairy_descriptions[fairy_id] = description
+    fairy_name_pairs.sort(key=itemgetter(0))
+
+    full_fairy_list = [NONE_STRING]
+    full_fairy_list.extend(description
+                           for _, description in fairy_name_pairs)
+    return [full_fairy_list, fairy_descriptions]
+
+
+@lru_cache(maxsize=None)
+def getFairyListComboboxWidth(sql_connection):
+    return max(map(len, buildFairyNameList(sql_connection)[0]))
+
+
+def resolveUid(sql_connection, query, entity_id):
+    """
+    Takes a query which returns a UID and contains a single ?-placeholder
+    for the entity id. Returns None if no matching card id was found.
+    """
+    try:
+        entity_id = int(entity_id)
+    except ValueError:
+        return None
+    result = fetchString(sql_connection, query, (entity_id,))
+    if result is None:
+        return None
+    return result[0]
 
 
 def generateRowUid(table_number):
-    return hex(randrange(16))[-1].upper() + \
-            hex(int(time.time() * 10))[-6:].upper() + \
-            str(table_number - 1)
+    return f'{randrange(16):X}' \
+        f'{int(time.time() * 10) & 0xffffff:06X}' \
+        f'{table_number - 1}'
+
+
+CARD_TYPE_PREFIXES_WITH_QUERIES = MappingProxyType({
+    '0': ('Item: ', ITEM_CARD_QUERY),
+    '1': ('Spell: ', SPELL_CARD_QUERY),
+    '2': ('Fairy: ', FAIRY_CARD_QUERY),
+})
 
 
 def resolveCardDescription(sql_connection, card_type, card_id):
     card_type = str(card_type)
-    card_id = str(card_id)
-
-    if card_type == '0':
-        query_string = 'select col_0_ForeignKey, col_1_Integer from _fb0x04'
-        spell_name = resolveCardIdName(sql_connection, query_string, card_id)
-        return 'Item: ' + spell_name
-    elif card_type == '1':
-        query_string = 'select col_0_ForeignKey, col_2_Integer from _fb0x03'
-        spell_name = resolveCardIdName(sql_connection, query_string, card_id)
-        return 'Spell: ' + spell_name
-    elif card_type == '2':
-        return 'Fairy: ' + resolveFairyName(sql_connection, card_id)
-    elif card_type == '3':
+    if card_type == '3':
         return 'Blank'
-    return 'NULL'
+    if card_type not in CARD_TYPE_PREFIXES_WITH_QUERIES:
+        return 'NULL'
+
+    prefix, query_string = CARD_TYPE_PREFIXES_WITH_QUERIES[card_type]
+    return prefix + \
+        resolveCardIdName(sql_connection, query_string, str(card_id))
 
 
 def replaceEntryContent(entry_box, new_content_string):
@@ -340,13 +497,20 @@ def replaceEntryContent(entry_box, new_content_string):
     entry_box.insert(tk.END, new_content_string)
 
 
+STRING_INSERT_QUERY = """insert into
+    _fb0x02 (UID, col_0_String, col_1_Integer, col_2_String)
+    values (?, ?, ?, ?)"""
+NPC_INSERT_QUERY = """insert into
+    _fb0x05 (UID, col_0_ForeignKey, col_1_String, col_2_String,
+             col_3_String, col_4_String, col_5_String, col_6_String)
+    values (?, ?, ?, ?, ?, ?, ?, ?)"""
+
+
 def insertStringIntoDatabase(sql_connection, string_type, string):
     new_uid = generateRowUid(2)
 
-    sql_cursor = sql_connection.cursor()
-    sql_cursor.execute("""insert into
-        _fb0x02 (UID, col_0_String, col_1_Integer, col_2_String)
-        values (?, ?, ?, ?)""", [
+    sql_cursor = getSharedCursor(sql_connection)
+    sql_cursor.execute(STRING_INSERT_QUERY, [
         new_uid,
         string,
         string_type,
@@ -357,7 +521,7 @@ def insertStringIntoDatabase(sql_connection, string_type, string):
 
 # Source:
 # https://github.com/Helco/zzio/blob/02a9cee6e3317e80c52f55950310c7b8ff371257/zzsc/zzsc.cs
-SCRIPT_COMMANDS = {
+SCRIPT_COMMANDS = MappingProxyType({
     '!': 'say',
     'C': 'setModel',
     '"': 'choice',
@@ -442,13 +606,13 @@ SCRIPT_COMMANDS = {
     't': 'deploySound',
     'u': 'givePlayerPresent',
     '7': 'endIf',
-}
-REVERSE_SCRIPT_COMMANDS = {}
-for key, value in SCRIPT_COMMANDS.items():
-    REVERSE_SCRIPT_COMMANDS[value] = key
+})
+REVERSE_SCRIPT_COMMANDS = MappingProxyType({
+    value: key for key, value in SCRIPT_COMMANDS.items()
+})
 
 # All commands not in this dictionary take zero arguments.
-script_command_parameters = {
+script_command_parameters = MappingProxyType({
     'label': ['id'],
     'goto': ['labelId'],
     'gotoRandomLabel': ['int', 'int'],
@@ -512,7 +676,23 @@ script_command_parameters = {
     'deploySound': ['id', 'triggerId'],
     'givePlayerPresent': ['UNUSED'],
     'startActorEffect': ['id'],
-}
+})
+
+MODIFY_WIZFORM_SUBCOMMANDS = MappingProxyType({
+    '0': '; Heal',
+    '1': '; Add exp',
+    '2': '; Clear status effects',
+    '8': '; Add exp to almost next level',
+    '16': '; Revive fairy',
+    '17': '; Fill up mana',
+    '18': '; Rename fairy',
+})
+LOOK_AT_PLAYER_MODES = MappingProxyType({
+    '-1': "Idle: Don't look at player",
+    '1': 'Rotate to player',
+    '2': 'Rotate to player smoothly',
+    '3': 'Rotate to player like a billboard',
+})
 
 # Source:
 # https://github.com/Helco/zzio/blob/02a9cee6e3317e80c52f55950310c7b8ff371257/zzio/AnimationType.cs#L5
@@ -527,6 +707,55 @@ AVAILABLE_ANIMATIONS = [
 ]
 
 
+SCRIPT_JUMPLABEL_COMMANDS = frozenset(['label', 'goto', 'gotoRandomLabel'])
+SCRIPT_PLAIN_COMMANDS = \
+    frozenset(SCRIPT_COMMANDS.values()) - SCRIPT_JUMPLABEL_COMMANDS
+
+# Words are matched generically and dispatched to their tag by set
+# membership in ScriptColorDelegator. This avoids scanning an
+# alternation of all ~70 command names at every position.
+SCRIPT_HIGHLIGHT_PATTERN = re.compile(
+    r'\b(?P<WORD>[A-Za-z_]+)\b' +
+    r'|' + r'\b(?P<NUMBER>[0-9]{1,4})\b' + r'|' +
+    r'(?P<COMMENT>//[^;\n]*)((?P<SPECIAL>;)(?P<INFOSTRING>[^\n]*))?', re.S)
+SCRIPT_HIGHLIGHT_TAGDEFS = MappingProxyType({
+    'JUMPLABEL': {'foreground': '#9d79d6'},
+    'COMMAND': {'foreground': '#86abdc'},
+    'NUMBER': {'foreground': '#f4a261'},
+    'COMMENT': {'foreground': '#738091'},
+    'SPECIAL': {'foreground': '#738091'},
+    'INFOSTRING': {'foreground': '#81b29a'},
+})
+
+
+class ScriptColorDelegator(colorizer.ColorDelegator):
+    """
+    ColorDelegator which resolves the tag of a word token with two set
+    lookups instead of a regex alternation over every script command.
+    """
+
+    def _add_tags_in_section(self, chars, head):
+        for match in self.prog.finditer(chars):
+            for name, matched_text in match.groupdict().items():
+                if not matched_text:
+                    continue
+                start, end = match.span(name)
+                if name == 'WORD':
+                    if matched_text in SCRIPT_JUMPLABEL_COMMANDS:
+                        name = 'JUMPLABEL'
+                    elif matched_text in SCRIPT_PLAIN_COMMANDS:
+                        name = 'COMMAND'
+                    else:
+                        continue
+                self.tag_add(name,
+                             f'{head}+{start:d}c', f'{head}+{end:d}c')
+
+
+# Worker thread for validating scripts without blocking the Tk main
+# loop. A single worker keeps results in submission order.
+COMPILE_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=1)
+
+
 def makeError(line_counter, message):
     return 'Line ' + str(line_counter + 1) + ': ' + message
 
@@ -539,20 +768,28 @@ def compile(script):
     [True, '...compiled code...']
     [False, ['error 1', 'error 2', ...]]
     """
-    output = ""
+    output_parts = []
     errors = []
+
+    # Bind hot globals to locals for faster access in the loop below.
+    reverse_script_commands = REVERSE_SCRIPT_COMMANDS
+    command_parameters = script_command_parameters
+
     for index, line in enumerate(script.split('\n')):
         line_without_comments = line.split('//')[0]
         tokens = splitByWhitespace(line_without_comments)
         if len(tokens) == 0:
             pass
-        elif not tokens[0] in REVERSE_SCRIPT_COMMANDS:
-            errors.append(makeError(index, 'Unknown command: ' + tokens[0]))
-            continue
         else:
             command = tokens[0]
-            if command in script_command_parameters:
-                parameters = script_command_parameters[command]
+            opcode = reverse_script_commands.get(command)
+            if opcode is None:
+                errors.append(makeError(index,
+                                        'Unknown command: ' + command))
+                continue
+
+            parameters = command_parameters.get(command)
+            if parameters is not None:
                 if len(tokens) - 1 != len(parameters):
                     errors.append(makeError(
                         index, 'Command ' + command + ' takes exactly ' +
@@ -566,13 +803,13 @@ def compile(script):
                 continue
 
             if index > 0:
-                output += '\n'
-            output += REVERSE_SCRIPT_COMMANDS[command]
+                output_parts.append('\n')
+            output_parts.append(opcode)
             if len(tokens) > 1:
-                output += '.'
-        output += '.'.join(tokens[1:])
+                output_parts.append('.')
+        output_parts.append('.'.join(tokens[1:]))
     if len(errors) == 0:
-        return [True, output + '\n']
+        return [True, ''.join(output_parts) + '\n']
     else:
         return [False, errors]
 
@@ -584,29 +821,35 @@ def compileAndShowErrorMessage(script):
     return [status, script_or_messages]
 
 
+@lru_cache(maxsize=512)
 def decompile(sql_connection, script):
-    result = ""
+    result_parts = []
     indentation = 0
+
+    # Bind hot globals to locals for faster access in the loop below.
+    script_commands = SCRIPT_COMMANDS
+    command_parameters = script_command_parameters
+
     for line in script.split('\n'):
         tokens = line.strip().split('.')
-        if tokens[0] in SCRIPT_COMMANDS:
-            command = SCRIPT_COMMANDS[tokens[0]]
+        if tokens[0] in script_commands:
+            command = script_commands[tokens[0]]
             if command == 'endIf':
                 indentation = max(indentation - 4, 0)
             if command != 'else':
-                result += ' ' * indentation
-            result += command
+                result_parts.append(' ' * indentation)
+            result_parts.append(command)
             if len(tokens) > 1:
-                result += ' ' + ' '.join(tokens[1:])
+                result_parts.append(' ' + ' '.join(tokens[1:]))
             if command.startswith('if'):
                 indentation += 4
-            if command in script_command_parameters:
-                result += makeDecompiledParameterComment(
-                    command, tokens[1:], sql_connection)
+            if command in command_parameters:
+                result_parts.append(makeDecompiledParameterComment(
+                    command, tokens[1:], sql_connection))
         else:
-            result += line
-        result += '\n'
-    return result
+            result_parts.append(line)
+        result_parts.append('\n')
+    return ''.join(result_parts)
 
 
 def indexListByMaybeInt(string_list, maybe_integer):
@@ -640,31 +883,16 @@ def makeDecompiledParameterComment(command, arguments, sql_connection):
         result += resolveCardDescription(
             sql_connection, arguments[1], arguments[2])
     elif command == 'modifyWizform':
-        subcommand_descriptions = {
-            '0': '; Heal',
-            '1': '; Add exp',
-            '2': '; Clear status effects',
-            '8': '; Add exp to almost next level',
-            '16': '; Revive fairy',
-            '17': '; Fill up mana',
-            '18': '; Rename fairy',
-        }
         if arguments[0] == '7':
             result += '; Evolve to '
             result += resolveFairyName(sql_connection, arguments[1])
-        elif arguments[0] in subcommand_descriptions:
-            result += '; ' + subcommand_descriptions[arguments[0]]
+        elif arguments[0] in MODIFY_WIZFORM_SUBCOMMANDS:
+            result += '; ' + MODIFY_WIZFORM_SUBCOMMANDS[arguments[0]]
     elif command == 'ifPlayerHasSpecials':
         result += makeDecompiledSpecialsComment(arguments)
     elif command == 'lookAtPlayer':
-        modes = {
-            '-1': "Idle: Don't look at player",
-            '1': 'Rotate to player',
-            '2': 'Rotate to player smoothly',
-            '3': 'Rotate to player like a billboard',
-        }
-        if arguments[1] in modes:
-            result += '; ' + modes[arguments[1]]
+        if arguments[1] in LOOK_AT_PLAYER_MODES:
+            result += '; ' + LOOK_AT_PLAYER_MODES[arguments[1]]
     elif command == 'playAnimation' or command == 'playPlayerAnimation':
         result += '; Animation: '
         result += indexListByMaybeInt(AVAILABLE_ANIMATIONS, arguments[0])
@@ -716,23 +944,37 @@ def makeCombobox(frame):
     return combobox
 
 
-def autoAdjustComboboxWidth(combobox):
-    combobox['width'] = len(max(combobox['values'], key=len))
+ELEMENT_CLASSES_COMBOBOX_WIDTH = max(map(len, ELEMENT_CLASSES))
+
+
+def autoAdjustComboboxWidth(combobox, width=None):
+    """
+    Fit the combobox to its longest value. Pass a precomputed width to
+    skip rescanning static value lists.
+    """
+    if width is None:
+        width = max(map(len, combobox['values']))
+    combobox['width'] = width
+
+
+MAX_INT_PATTERN = re.compile(r'^(|[1-9][0-9]{0,10})$', re.S)
+LEVEL_PATTERN = re.compile(r'^(|[1-5]?[0-9]|60)$', re.S)  # MAX_LEVEL
+SIGNED_INT_PATTERN = re.compile(r'^-?[0-9]*$', re.S)
+STRING_UID_PREFIX_PATTERN = re.compile(r'^String\([^\)]+\) ')
 
 
-def makeCheckedEntry(frame, validation_regex_string):
+def makeCheckedEntry(frame, validation_pattern):
     entry = tk.Entry(frame, validate='key')
     entry['validatecommand'] = [
         entry.register(
-            lambda string:
-            re.match(validation_regex_string, string, re.S) is not None
+            lambda string: validation_pattern.match(string) is not None
         ), '%P'
     ]
     return entry
 
 
 def makeLevelEntry(frame):
-    entry = makeCheckedEntry(frame, r'^(|[1-5]?[0-9]|60)$')  # MAX_LEVEL
+    entry = makeCheckedEntry(frame, LEVEL_PATTERN)
     entry['width'] = 5
     return entry
 
@@ -755,28 +997,42 @@ def makeStatChooser(frame, row, label_text):
     return makeListChooser(frame, row, label_text, level_strings)
 
 
+@lru_cache(maxsize=None)
 def toCircleString(value, max_value):
     return value * '●' + (max_value - value) * '○'
 
 
+# Stats are tiny bounded ints, so the common range is precomputed once.
+STAT_STRING_TABLE = tuple(toCircleString(value + 1, 5)
+                          for value in range(256))
+
+
 def toStatString(value):
     """
     Expands a value like 2 to '●●●○○'
     """
+    if 0 <= value < 256:
+        return STAT_STRING_TABLE[value]
     return toCircleString(value + 1, 5)
 
 
+SEARCHABLE_TRANSLATION_TABLE = str.maketrans({
+    '●': '*',
+    '○': None,
+    ELEMENT_CLASSES[-1]: '*',
+})
+
+
 def makeStringSearchable(string):
-    return string \
-        .replace('●', '*') \
-        .replace('○', '') \
-        .replace(ELEMENT_CLASSES[-1], '*')
+    return string.translate(SEARCHABLE_TRANSLATION_TABLE)
 
 
 DIALOG_INCOMPLETE_REGEX = r'\{[^\{\}\n]*(\{|\n|$)'
 DIALOG_HIGHLIGHT_REGEX = \
     r'(?P<DIALOGINCOMPLETE>' + DIALOG_INCOMPLETE_REGEX + \
     r')|(?P<DIALOGSTART>\{[0-9]*\*)(?P<DIALOG>[^\}\n]*)(?P<DIALOGEND>\})'
+DIALOG_INCOMPLETE_PATTERN = re.compile(DIALOG_INCOMPLETE_REGEX, re.S)
+DIALOG_HIGHLIGHT_PATTERN = re.compile(DIALOG_HIGHLIGHT_REGEX, re.S)
 
 
 def addDialogHighlightGroups(tagdefs):
@@ -786,13 +1042,62 @@ def addDialogHighlightGroups(tagdefs):
     tagdefs['DIALOGINCOMPLETE'] = {'foreground': '#a5222f'}
 
 
+# Static part of the search result highlighting; the per-query
+# HIGHLIGHTED group gets appended in buildSearchHighlightPattern().
+SEARCH_HIGHLIGHT_REGEX = \
+    r'(?P<TRUNCATED>(^|\n)\.\.\.truncated.*$)' + \
+    r'|(^|\n)(?P<TYPE>(Command|Dialog|Fairy|Item|NPC|' + \
+    r'Spell|String)\()(?P<UID>[^\)]+)(?P<CLOSINGPAREN>\))' + \
+    r'|(?P<SLOTSSTART>\[)(?P<SLOTS>[^\]]+)(?P<SLOTSEND>\])' + \
+    r'|(?P<ATTRIBSTART> (Mana|Speed|Damage|Model|MaxHP|Speed' + \
+    r'|Jump|Special|Evolution)\()(?P<ATTRIBVARS>[^\)]+)' + \
+    r'(?P<ATTRIBEND>\))|' + DIALOG_HIGHLIGHT_REGEX
+SEARCH_HIGHLIGHT_PATTERN = re.compile(SEARCH_HIGHLIGHT_REGEX, re.IGNORECASE)
+
+
+@lru_cache(maxsize=32)
+def buildSearchHighlightPattern(search_strings):
+    """
+    Takes the whitespace-separated query tokens as a tuple and returns
+    the compiled highlight pattern. Memoized so retyping the same query
+    skips the regex compilation.
+    """
+    if len(search_strings) == 0:
+        return SEARCH_HIGHLIGHT_PATTERN
+    # Longer tokens first, so overlapping tokens highlight the longest
+    # match and the engine discards prefixes early.
+    ordered_strings = sorted(search_strings, key=len, reverse=True)
+    regex = SEARCH_HIGHLIGHT_REGEX
+    regex += r'|(?P<HIGHLIGHTED>('
+    regex += '|'.join(re.escape(s) for s in ordered_strings)
+    regex += r'))'
+    return re.compile(regex, re.IGNORECASE)
+
+
+# Every tag gets its own dict so reconfiguring one can't silently
+# change another.
+SEARCH_HIGHLIGHT_TAGDEFS = MappingProxyType({
+    'HIGHLIGHTED': {'foreground': '#cdcecf', 'background': '#3c5372'},
+    'TRUNCATED': {'foreground': '#c94f6d'},
+    'TYPE': {'foreground': '#9d79d6'},
+    'UID': {'foreground': '#86abdc'},
+    'CLOSINGPAREN': {'foreground': '#9d79d6'},
+    'SLOTSSTART': {'foreground': '#f6b079'},
+    'SLOTS': {'foreground': '#dbc074'},
+    'SLOTSEND': {'foreground': '#f6b079'},
+    'ATTRIBSTART': {'foreground': '#f6b079'},
+    'ATTRIBVARS': {'foreground': '#dbc074'},
+    'ATTRIBEND': {'foreground': '#f6b079'},
+})
+
+
 class StringDialogBox:
     def __init__(self, parent_frame):
         self.text_box = makeTextBox(parent_frame, tk.Text)
         self.text_box.configure(undo=True, maxundo=-1)
 
         self.delegator = colorizer.ColorDelegator()
-        self.delegator.prog = re.compile(DIALOG_HIGHLIGHT_REGEX, re.S)
+        self.delegator.prog = DIALOG_HIGHLIGHT_PATTERN
         addDialogHighlightGroups(self.delegator.tagdefs)
         percolator.Percolator(self.text_box).insertfilter(self.delegator)
 
@@ -808,7 +1113,7 @@ class StringDialogBox:
         """
         Check the content of this text box for errors. Returns None on success.
         """
-        if re.search(DIALOG_INCOMPLETE_REGEX, self.get(), re.S) is not None:
+        if DIALOG_INCOMPLETE_PATTERN.search(self.get()) is not None:
             return 'Incomplete highlighting sequence is missing "}"'
         return None
 
@@ -878,8 +1183,11 @@ class CodeBox:
         self.text_box.configure(wrap='none', undo=True, maxundo=-1)
         self.text_box.pack(fill=tk.BOTH, expand=True, side=tk.TOP)
         self.text_box.bind('<KeyRelease>', self.__checkScriptForErrors)
+        self.check_pending = False
+        self.latest_check_future = None
         self.delegator = self.__makeColorDelegator()
-        percolator.Percolator(self.text_box).insertfilter(self.delegator)
+        self.percolator = percolator.Percolator(self.text_box)
+        self.percolator.insertfilter(self.delegator)
 
         self.error_bar = tk.Label(
             frame, foreground='#dfdfe0', background='#3c2c3c',
@@ -894,7 +1202,13 @@ class CodeBox:
 
         state = self.__popState()
         self.text_box['autoseparator'] = False
+        # Bypass the colorizer during the bulk replace; the final text
+        # gets recolored in one pass below. Detaching clears the
+        # delegator's allow_colorizing flag, so restore it.
+        self.percolator.removefilter(self.delegator)
         self.text_box.replace('1.0', tk.END, new_text)
+        self.percolator.insertfilter(self.delegator)
+        self.delegator.allow_colorizing = True
         self.text_box['autoseparator'] = True
         self.delegator.notify_range('1.0', tk.END)
         self.__restoreState(state)
@@ -915,7 +1229,28 @@ class CodeBox:
         self.text_box['state'] = 'disabled'
 
     def __checkScriptForErrors(self, _):
-        status, error_messages = compile(self.getContent())
+        """
+        Schedule a single error check per event-loop cycle, no matter how
+        many keystrokes arrive in the meantime.
+        """
+        if self.check_pending:
+            return
+        self.check_pending = True
+        self.text_box.after_idle(self.__runScriptErrorCheck)
+
+    def __runScriptErrorCheck(self):
+        self.check_pending = False
+        future = COMPILE_EXECUTOR.submit(compile, self.getContent())
+        self.latest_check_future = future
+        future.add_done_callback(
+            lambda future:
+            self.text_box.after(0, self.__showScriptErrors, future))
+
+    def __showScriptErrors(self, future):
+        if future is not self.latest_check_future:
+            return  # A newer check is already underway.
+
+        status, error_messages = future.result()
         if status is True:
             self.error_bar.pack_forget()
         else:
@@ -926,21 +1261,9 @@ class CodeBox:
         """
         Return a ColorDelegator for syntax highlighting in scripts.
         """
-        jumplabels = ['label', 'goto', 'gotoRandomLabel']
-        commands = (s for s in SCRIPT_COMMANDS.values() if s not in jumplabels)
-
-        delegator = colorizer.ColorDelegator()
-        regex = r'\b(?P<JUMPLABEL>(' + r'|'.join(jumplabels) + r'))\b' + \
-            r'|' + r'\b(?P<COMMAND>(' + r'|'.join(commands) + r'))\b' + \
-            r'|' + r'\b(?P<NUMBER>[0-9]{1,4})\b' + r'|' + \
-            r'(?P<COMMENT>//[^;\n]*)((?P<SPECIAL>;)(?P<INFOSTRING>[^\n]*))?'
-        delegator.prog = re.compile(regex, re.S)
-        delegator.tagdefs['JUMPLABEL'] = {'foreground': '#9d79d6'}
-        delegator.tagdefs['COMMAND'] = {'foreground': '#86abdc'}
-        delegator.tagdefs['NUMBER'] = {'foreground': '#f4a261'}
-        delegator.tagdefs['COMMENT'] = {'foreground': '#738091'}
-        delegator.tagdefs['SPECIAL'] = delegator.tagdefs['COMMENT']
-        delegator.tagdefs['INFOSTRING'] = {'foreground': '#81b29a'}
+        delegator = ScriptColorDelegator()
+        delegator.prog = SCRIPT_HIGHLIGHT_PATTERN
+        delegator.tagdefs.update(SCRIPT_HIGHLIGHT_TAGDEFS)
         return delegator
 
     def __popState(self):
@@ -967,13 +1290,39 @@ class ElementClassComboboxSet:
 
     def get(self, slot_index):
         self.__assertSlotIndex(slot_index)
-        return ELEMENT_CLASSES.index(self.comboboxes[slot_index].get())
+        return ELEMENT_CLASS_TO_INDEX[self.comboboxes[slot_index].get()]
+
+    def getAll(self):
+        """
+        Returns the values of all three slots at once, without per-slot
+        index checks.
+        """
+        return tuple(ELEMENT_CLASS_TO_INDEX[combobox.get()]
+                     for combobox in self.comboboxes)
 
     def set(self, slot_index, new_value):
         self.__assertSlotIndex(slot_index)
         self.comboboxes[slot_index].set(ELEMENT_CLASSES[new_value])
         self.comboboxes[slot_index].event_generate('<<ComboboxSelected>>')
 
+    def setAll(self, slot0, slot1, slot2):
+        """
+        Set all three slots at once. Unlike three set() calls, this does
+        not fire the chained <<ComboboxSelected>> cascade; the follower
+        states get adjusted directly.
+        """
+        none_sentinel = ELEMENT_CLASSES[0]
+        for combobox, new_value in zip(self.comboboxes,
+                                       (slot0, slot1, slot2)):
+            combobox.set(ELEMENT_CLASSES[new_value])
+        for combobox, following_combobox in zip(self.comboboxes,
+                                                self.comboboxes[1:]):
+            if combobox.get() == none_sentinel:
+                following_combobox['state'] = 'disabled'
+                following_combobox.set(none_sentinel)
+            else:
+                following_combobox['state'] = 'readonly'
+
     def hide(self):
         self.slots_frame.grid_forget()
 
@@ -984,7 +1333,7 @@ class ElementClassComboboxSet:
         combobox = makeCombobox(frame)
         combobox.configure(values=ELEMENT_CLASSES)
         combobox.set(combobox['values'][0])
-        autoAdjustComboboxWidth(combobox)
+        autoAdjustComboboxWidth(combobox, ELEMENT_CLASSES_COMBOBOX_WIDTH)
         combobox.pack(fill=tk.BOTH, expand=False, side=tk.LEFT)
         return combobox
 
@@ -997,9 +1346,10 @@ class ElementClassComboboxSet:
                       self.__updateSlotCombobox(combobox, following_combobox))
 
     def __updateSlotCombobox(self, combobox, following_combobox):
-        if combobox.get() == ELEMENT_CLASSES[0]:
+        none_sentinel = ELEMENT_CLASSES[0]
+        if combobox.get() == none_sentinel:
             following_combobox['state'] = 'disabled'
-            following_combobox.set(ELEMENT_CLASSES[0])
+            following_combobox.set(none_sentinel)
             following_combobox.event_generate('<<ComboboxSelected>>')
         else:
             following_combobox['state'] = 'readonly'
@@ -1040,10 +1390,17 @@ class SpellSlotProgressionTable:
 
         active_values = [value for value in progression_values if value != -1]
 
+        # Adjust the row count from the end, so rows which stay active
+        # keep their grid position and are not re-gridded.
         while len(self.active_rows) > len(active_values):
-            self.__deactivateRow(self.active_rows[0])
+            row = self.active_rows.pop()
+            row.hide()
+            self.inactive_rows.append(row)
         while len(self.active_rows) < len(active_values):
-            self.__activateRow(0)
+            row = self.inactive_rows.pop()
+            row.show(len(self.active_rows) + 1)  # Account for title row.
+            self.active_rows.append(row)
+        self.__updateAddButton()
 
         for row, new_value in zip(self.active_rows, active_values):
             row.setValue(new_value)
@@ -1061,8 +1418,7 @@ class SpellSlotProgressionTable:
             return None
 
         values.sort()
-        while len(values) < self.row_limit:
-            values.append(-1)
+        values += [-1] * (self.row_limit - len(values))
         return values
 
     def __addNewRow(self):
@@ -1077,11 +1433,13 @@ class SpellSlotProgressionTable:
 
     def __deactivateRow(self, row):
         row.hide()
-        self.active_rows.remove(row)
+        index = self.active_rows.index(row)
+        del self.active_rows[index]
         self.inactive_rows.append(row)
 
-        for index, row in enumerate(self.active_rows):
-            row.show(index + 1)
+        # Only rows below the removed one have to move up.
+        for following_index in range(index, len(self.active_rows)):
+            self.active_rows[following_index].show(following_index + 1)
 
         self.__updateAddButton()
 
@@ -1117,9 +1475,7 @@ class SpellSlotProgressionTable:
             if len(self.entry.get()) == 0:
                 return None
 
-            slot0 = self.combobox_set.get(0)
-            slot1 = self.combobox_set.get(1)
-            slot2 = self.combobox_set.get(2)
+            slot0, slot1, slot2 = self.combobox_set.getAll()
             level = int(self.entry.get())
             slot_position = self.deck_slot.get()
 
@@ -1128,17 +1484,16 @@ class SpellSlotProgressionTable:
                    ((level & 0xffff) << 16)
 
         def setValue(self, integer_bits):
-            slot2 = min((integer_bits >> 0) & 0xf, len(ELEMENT_CLASSES) - 1)
-            slot1 = min((integer_bits >> 4) & 0xf, len(ELEMENT_CLASSES) - 1)
-            slot0 = min((integer_bits >> 8) & 0xf, len(ELEMENT_CLASSES) - 1)
+            last_element_class = len(ELEMENT_CLASSES) - 1
+            slot2 = min((integer_bits >> 0) & 0xf, last_element_class)
+            slot1 = min((integer_bits >> 4) & 0xf, last_element_class)
+            slot0 = min((integer_bits >> 8) & 0xf, last_element_class)
             slot_position = min((integer_bits >> 12) & 0b11, 3)
             level = (integer_bits >> 16) & 0xffff
 
             self.deck_slot.set(slot_position)
             replaceEntryContent(self.entry, str(level))
-            self.combobox_set.set(2, slot2)
-            self.combobox_set.set(1, slot1)
-            self.combobox_set.set(0, slot0)
+            self.combobox_set.setAll(slot0, slot1, slot2)
 
         def show(self, row):
             self.entry.grid(row=row, column=0, sticky='w')
@@ -1168,7 +1523,7 @@ class NPCNameCombobox:
         self.combobox.grid(row=row, column=column, sticky='we')
 
     def reloadNamesFromDatabase(self):
-        sql_cursor = self.sql_connection.cursor()
+        sql_cursor = getSharedCursor(self.sql_connection)
         sql_cursor.execute("""select UID, col_0_String from _fb0x02
         where col_1_Integer = 5 order by col_0_String""")
         npc_info_pairs = sql_cursor.fetchall()
@@ -1182,7 +1537,7 @@ class NPCNameCombobox:
         return True
 
     def getName(self):
-        return re.sub(r'^String\([^\)]+\) ', '', self.combobox.get())
+        return STRING_UID_PREFIX_PATTERN.sub('', self.combobox.get())
 
     def getUid(self):
         return extractUid(self.combobox.get())
@@ -1224,9 +1579,8 @@ class FairyEditorView:
         self.jump_ability = makeStatChooser(fairy_frame, 1, 'Jump Ability')
         self.special = makeStatChooser(fairy_frame, 2, 'Special')
 
-        max_int_regex = r'^(|[1-9][0-9]{0,10})$'
         self.__makeRowLabel(fairy_frame, 'HP at Max Level', 3)
-        self.hp_limit_entry = makeCheckedEntry(fairy_frame, max_int_regex)
+        self.hp_limit_entry = makeCheckedEntry(fairy_frame, MAX_INT_PATTERN)
         self.hp_limit_entry.grid(row=3, column=1, sticky='we')
 
         self.__makeRowLabel(fairy_frame, 'Model/Mesh', 4)
@@ -1263,13 +1617,12 @@ class FairyEditorView:
         sortable_glow_list.sort(key=lambda values: values[0])
         glow_combobox_values = []
         self.glow_to_id_mapping = {}
+        self.id_to_glow_mapping = {}
         for _, string, intensity, index in sortable_glow_list:
             full_string = toCircleString(intensity, 3) + ' ' + string
             self.glow_to_id_mapping[full_string] = index
+            self.id_to_glow_mapping[index] = full_string
             glow_combobox_values.append(full_string)
-        self.id_to_glow_mapping = {}
-        for key, value in self.glow_to_id_mapping.items():
-            self.id_to_glow_mapping[value] = key
 
         self.__makeRowLabel(fairy_frame, 'Glow Effect', 7)
         self.glow_combobox = makeCombobox(fairy_frame)
@@ -1291,8 +1644,10 @@ class FairyEditorView:
         tabs.add(exp_curve_frame, text='Experience Curve')
 
         self.__makeRowLabel(exp_curve_frame, 'Coefficient', 0)
-        coefficient_entry = makeCheckedEntry(exp_curve_frame, max_int_regex)
+        coefficient_entry = makeCheckedEntry(exp_curve_frame,
+                                             MAX_INT_PATTERN)
         coefficient_entry.grid(row=0, column=1, sticky='w')
+        self.redraw_after_id = None
         self.exp_coefficient = tk.StringVar()
         self.exp_coefficient.trace_add('write', self.__updateExpCoefficient)
         coefficient_entry['textvariable'] = self.exp_coefficient
@@ -1321,21 +1676,22 @@ class FairyEditorView:
             row=1, column=0, columnspan=2, sticky='nswe')
         plot_figure.tight_layout()
 
+        self.entries_to_check = (
+            (self.hp_limit_entry, 'hp limit'),
+            (self.exp_coefficient, 'experience coefficient'),
+            (self.model_entry, 'model string'),
+        )
+
     def setupEditForID(self, fairy_id):
         self.current_fairy_uid = resolveUid(
-            self.sql_connection, 'select UID, col_3_Integer from _fb0x01',
+            self.sql_connection,
+            'select UID from _fb0x01 where (col_3_Integer >> 16) & 65535 =?',
             fairy_id)
         if self.current_fairy_uid is None:
             return False
 
-        sql_cursor = self.sql_connection.cursor()
-        sql_cursor.execute("""select
-        col_0_String, col_2_Integer, col_5_Integer, col_6_Integer,
-        col_7_Integer, col_8_Integer, col_9_Integer, col_10_Integer,
-        col_11_Integer, col_12_Integer, col_13_Integer, col_14_Integer,
-        col_16_Integer, col_17_Integer, col_18_Integer, col_19_Integer,
-        col_20_Integer, col_21_Integer, col_23_Integer, col_25_Integer
-        from _fb0x01 where UID = ?""", [self.current_fairy_uid])
+        sql_cursor = getSharedCursor(self.sql_connection)
+        sql_cursor.execute(FAIRY_DETAILS_QUERY, [self.current_fairy_uid])
         query_result = sql_cursor.fetchone()
         if query_result is None:
             return False
@@ -1345,25 +1701,10 @@ class FairyEditorView:
         hp_limit, evolution_fairy_id, evolution_level, move_speed, \
             jump_ability, special, glow_id, exp_coefficient = query_result[12:]
 
-        sql_cursor.execute(
-            'select col_1_ForeignKey, col_3_Integer from _fb0x01')
-        query_result = sql_cursor.fetchall()
-        if query_result is None:
-            return False
-
-        evolution_item = NONE_STRING
-        fairy_name_pairs = []
-        for name_uid, card_id in query_result:
-            name_uid = name_uid.split('|')[0]
-            name = resolveLabel(self.sql_connection, name_uid)
-            fairy_id = getCardEntityId(card_id)
-            description = 'Fairy(' + str(fairy_id) + ') ' + name
-            fairy_name_pairs.append([name, description])
-            if fairy_id == evolution_fairy_id:
-                evolution_item = description
-        fairy_name_pairs.sort(key=lambda pair: pair[0])
-        full_fairy_list = [NONE_STRING]
-        full_fairy_list += [pair[1] for pair in fairy_name_pairs]
+        full_fairy_list, fairy_descriptions = \
+            buildFairyNameList(self.sql_connection)
+        evolution_item = fairy_descriptions.get(evolution_fairy_id,
+                                                NONE_STRING)
 
         if element_class < 0 or element_class >= len(ELEMENT_CLASSES):
             self.element_class_combobox.set(ELEMENT_CLASSES[0])
@@ -1376,7 +1717,9 @@ class FairyEditorView:
 
         self.evolution_combobox['values'] = full_fairy_list
         self.evolution_combobox.set(evolution_item)
-        autoAdjustComboboxWidth(self.evolution_combobox)
+        autoAdjustComboboxWidth(
+            self.evolution_combobox,
+            getFairyListComboboxWidth(self.sql_connection))
         replaceEntryContent(self.evolution_level_entry, str(evolution_level))
         self.evolution_combobox.event_generate('<<ComboboxSelected>>')
 
@@ -1394,17 +1737,13 @@ class FairyEditorView:
 
     def writeChangesToDatabase(self):
         if self.evolution_combobox.current() != 0 and \
-                len(self.evolution_level_entry.get()) == 0:
+                not self.evolution_level_entry.get():
             return self.__invalidInput('No evolution level specified')
-        entries_to_check = [
-            (self.hp_limit_entry, 'hp limit'),
-            (self.exp_coefficient, 'experience coefficient'),
-            (self.model_entry, 'model string'),
-        ]
-        for entry, description in entries_to_check:
-            if len(entry.get()) == 0:
+        for entry, description in self.entries_to_check:
+            content = entry.get()
+            if not content:
                 return self.__invalidInput('No ' + description + ' specified')
-            if entry.get() == '-':
+            if content == '-':
                 return self.__invalidInput(
                     'Incomplete ' + description + ' specified')
 
@@ -1419,31 +1758,25 @@ class FairyEditorView:
                 int(extractUid(self.evolution_combobox.get()))
             evolution_level = int(self.evolution_level_entry.get())
 
-        sql_cursor = self.sql_connection.cursor()
-        sql_cursor.execute("""update _fb0x01 set
-        col_0_String=?, col_2_Integer=?, col_5_Integer=?, col_6_Integer=?,
-        col_7_Integer=?, col_8_Integer=?, col_9_Integer=?, col_10_Integer=?,
-        col_11_Integer=?, col_12_Integer=?, col_13_Integer=?, col_14_Integer=?,
-        col_16_Integer=?, col_17_Integer=?, col_18_Integer=?, col_19_Integer=?,
-        col_20_Integer=?, col_21_Integer=?, col_23_Integer=?, col_25_Integer=?
-        where UID = ?""", [
-            self.model_entry.get(),
-            ELEMENT_CLASSES.index(self.element_class_combobox.get()),
-            spell_slot_progression[0], spell_slot_progression[1],
-            spell_slot_progression[2], spell_slot_progression[3],
-            spell_slot_progression[4], spell_slot_progression[5],
-            spell_slot_progression[6], spell_slot_progression[7],
-            spell_slot_progression[8], spell_slot_progression[9],
-            int(self.hp_limit_entry.get()),
-            evolution_fairy_id,
-            evolution_level,
-            self.move_speed.get(),
-            self.jump_ability.get(),
-            self.special.get(),
-            self.glow_to_id_mapping[self.glow_combobox.get()],
-            int(self.exp_coefficient.get()),
-            self.current_fairy_uid,
-        ])
+        parameters = {
+            'model': self.model_entry.get(),
+            'element_class':
+                ELEMENT_CLASS_TO_INDEX[self.element_class_combobox.get()],
+            'hp_limit': int(self.hp_limit_entry.get()),
+            'evolution_fairy_id': evolution_fairy_id,
+            'evolution_level': evolution_level,
+            'move_speed': self.move_speed.get(),
+            'jump_ability': self.jump_ability.get(),
+            'special': self.special.get(),
+            'glow_id': self.glow_to_id_mapping[self.glow_combobox.get()],
+            'exp_coefficient': int(self.exp_coefficient.get()),
+            'uid': self.current_fairy_uid,
+        }
+        for index, value in enumerate(spell_slot_progression):
+            parameters['slot_' + str(index)] = value
+
+        sql_cursor = getSharedCursor(self.sql_connection)
+        sql_cursor.execute(FAIRY_UPDATE_QUERY, parameters)
 
         return True
 
@@ -1474,14 +1807,27 @@ class FairyEditorView:
         coefficient = int(self.exp_coefficient.get())
         limit = 70000  # Value which works best with the formula
         if coefficient > limit:
-            coefficient = limit
-            self.exp_coefficient.set(coefficient)
+            # Re-triggers this trace with the clamped value, which then
+            # does the single recompute.
+            self.exp_coefficient.set(limit)
+            return
 
-        self.plotted_values.set_ydata([
-            self.__getExpForLevel(level, coefficient)
-            for level in range(0, MAX_LEVEL + 1)
-        ])
-        self.plot_canvas.draw()
+        self.plotted_values.set_ydata(self.__getExpCurve(coefficient))
+        self.__scheduleRedraw()
+
+    def __scheduleRedraw(self):
+        """
+        Redraw the plot at most once per typing burst. The full
+        matplotlib redraw dwarfs the curve computation by far.
+        """
+        widget = self.plot_canvas.get_tk_widget()
+        if self.redraw_after_id is not None:
+            widget.after_cancel(self.redraw_after_id)
+        self.redraw_after_id = widget.after(80, self.__redrawPlot)
+
+    def __redrawPlot(self):
+        self.redraw_after_id = None
+        self.plot_canvas.draw_idle()
 
     def __formatExperienceAxis(self, value, _):
         if value == 0:
@@ -1490,11 +1836,14 @@ class FairyEditorView:
             return '{:.1f}'.format(value / 1000) + 'k'
 
     # https://github.com/Helco/zzio/blob/02a9cee6e3317e80c52f55950310c7b8ff371257/zzre/game/Inventory.GameLogic.cs#L180
-    def __getExpForLevel(self, level, coefficient):
+    def __getExpCurve(self, coefficient):
+        """
+        Computes the required experience for all levels at once.
+        """
         exponent_factor = 0.001
         base_exp = pow(MAX_EXPERIENCE, coefficient * exponent_factor)
         exponent = 1.0 / (coefficient * exponent_factor)
-        return pow(base_exp * level / MAX_LEVEL, exponent)
+        return (base_exp * EXPERIENCE_CURVE_LEVELS / MAX_LEVEL) ** exponent
 
 
 class StringDialogEditorView:
@@ -1527,7 +1876,7 @@ class StringDialogEditorView:
         if not self.string_dialog_box.prepareForWritingToDB():
             return False
 
-        sql_cursor = self.sql_connection.cursor()
+        sql_cursor = getSharedCursor(self.sql_connection)
         sql_cursor.execute(
             'update ' + self.table_name +
             ' set col_0_String = ? where UID = ?',
@@ -1584,24 +1933,22 @@ class SpellEditorView:
         self.current_spell_uid = None
 
         uid = resolveUid(
-            self.sql_connection, 'select UID, col_2_Integer from _fb0x03',
+            self.sql_connection,
+            'select UID from _fb0x03 where (col_2_Integer >> 16) & 65535 =?',
             spell_id)
         if uid is None:
             return False
 
-        sql_cursor = self.sql_connection.cursor()
-        sql_cursor.execute("""select col_1_Integer, col_3_Byte, col_4_Byte,
-        col_5_Byte, col_6_ForeignKey, col_7_Integer, col_8_Integer,
-        col_10_Integer, col_11_Integer, col_12_Integer, col_13_Integer
-        from _fb0x03 where UID = ?""", [uid])
+        sql_cursor = getSharedCursor(self.sql_connection)
+        sql_cursor.execute(SPELL_DETAILS_QUERY, [uid])
         query_result = sql_cursor.fetchone()
         if query_result is None:
             return False
 
         is_passive, slot_0, slot_1, slot_2, info_uid, mana, cast_speed, \
             missile_effect, impact_effect, damage, spell_effect = query_result
-        self.current_spell_uid_db_suffix = info_uid.split('|')[1]
-        info_uid = info_uid.split('|')[0]
+        info_uid, _, self.current_spell_uid_db_suffix = \
+            info_uid.partition('|')
 
         sql_cursor.execute("""select UID, col_0_String from _fb0x02
         where col_1_Integer = 10 order by col_0_String""")
@@ -1624,9 +1971,9 @@ class SpellEditorView:
         replaceEntryContent(self.missile_entry, str(missile_effect))
         replaceEntryContent(self.impact_entry, str(impact_effect))
 
-        all_spell_strings = ACTIVE_SPELL_CRIT_EFFECTS + \
-            PASSIVE_SPELL_EFFECTS + spell_info_strings
-        effect_combobox_len = len(max(all_spell_strings, key=len))
+        effect_combobox_len = max(
+            SPELL_EFFECT_COMBOBOX_WIDTH,
+            max(map(len, spell_info_strings), default=0))
         self.effect_combobox['width'] = effect_combobox_len
         self.effect_info_combobox['width'] = effect_combobox_len
 
@@ -1648,24 +1995,26 @@ class SpellEditorView:
                 self.effect_info_combobox.get())
             return False
 
-        effect_animation_regex = re.compile(r'^(-1|[0-9]+)$', re.S)
+        effect_animations = []
         for entry, name in [[self.missile_entry, 'Missile'],
                             [self.impact_entry, 'Impact']]:
-            if not effect_animation_regex.match(entry.get()):
+            try:
+                value = int(entry.get())
+                if value < -1:
+                    raise ValueError
+            except ValueError:
                 tkmessagebox.showerror(
                     'Invalid Integer',
                     name + ' effect entry contains invalid integer')
                 return False
+            effect_animations.append(value)
+        missile_effect, impact_effect = effect_animations
         info_uid = \
             self.spell_info_to_uid_mapping[self.effect_info_combobox.get()] + \
             '|' + self.current_spell_uid_db_suffix
 
-        sql_cursor = self.sql_connection.cursor()
-        sql_cursor.execute("""update _fb0x03 set
-        col_1_Integer=?, col_3_Byte=?, col_4_Byte=?, col_5_Byte=?,
-        col_6_ForeignKey=?, col_7_Integer=?, col_8_Integer=?, col_10_Integer=?,
-        col_11_Integer=?, col_12_Integer=?, col_13_Integer=?
-        where UID = ?""", [
+        sql_cursor = getSharedCursor(self.sql_connection)
+        sql_cursor.execute(SPELL_UPDATE_QUERY, [
             self.type_value.get(),
             self.slot_comboboxes.get(0),
             self.slot_comboboxes.get(1),
@@ -1673,8 +2022,8 @@ class SpellEditorView:
             info_uid,
             self.mana_value.get(),
             self.cast_speed_value.get(),
-            int(self.missile_entry.get()),
-            int(self.impact_entry.get()),
+            missile_effect,
+            impact_effect,
             self.damage_value.get(),
             self.effect_combobox.current(),
             self.current_spell_uid,
@@ -1700,7 +2049,7 @@ class SpellEditorView:
 
     def __makeEffectEntryBox(self, frame, row, label_text):
         tk.Label(frame, text=label_text).grid(row=row, column=0, sticky='w')
-        entry = makeCheckedEntry(frame, r'^-?[0-9]*$')
+        entry = makeCheckedEntry(frame, SIGNED_INT_PATTERN)
         entry.grid(row=row, column=1, sticky='w')
         return entry
 
@@ -1725,13 +2074,16 @@ class ItemEditorView:
         return True
 
     def fetchUidAndDecompiledScript(self, item_id):
-        sql_cursor = self.sql_connection.cursor()
-        sql_cursor.execute(
-            'select UID, col_1_Integer, col_4_String from _fb0x04')
-        for uid, card_id, script in sql_cursor.fetchall():
-            if str(getCardEntityId(card_id)) == item_id:
-                return [uid, decompile(self.sql_connection, str(script))]
-        return None
+        try:
+            item_id = int(item_id)
+        except ValueError:
+            return [None, None]
+        sql_cursor = getSharedCursor(self.sql_connection)
+        sql_cursor.execute(ITEM_SCRIPT_QUERY, [item_id])
+        result = sql_cursor.fetchone()
+        if result is None:
+            return [None, None]
+        return [result[0], decompile(self.sql_connection, str(result[1]))]
 
     def writeChangesToDatabase(self):
         if self.current_item_uid is None:
@@ -1742,10 +2094,9 @@ class ItemEditorView:
         if success is False:
             return False
 
-        sql_cursor = self.sql_connection.cursor()
-        sql_cursor.execute(
-            'update _fb0x04 set col_4_String = ? where UID = ?',
-            [compiled_script, self.current_item_uid])
+        sql_cursor = getSharedCursor(self.sql_connection)
+        sql_cursor.execute(ITEM_UPDATE_QUERY,
+                           [compiled_script, self.current_item_uid])
 
         reformated_script = decompile(self.sql_connection, compiled_script)
         self.code_box.replaceContent(reformated_script)
@@ -1784,27 +2135,20 @@ class NPCEditorView:
     def setupEditForID(self, npc_uid):
         self.fullReset()
 
-        scripts = fetchAllNpcScripts(self.sql_connection, npc_uid)
-        if scripts is None:
+        result = fetchString(self.sql_connection, NPC_DETAILS_QUERY,
+                             (npc_uid,))
+        if result is None:
             return False
         if not self.name_combobox.reloadNamesFromDatabase():
             return False
 
-        sql_cursor = self.sql_connection.cursor()
-        sql_cursor.execute(
-            "select col_0_ForeignKey from _fb0x05 where UID = ?",
-            [npc_uid])
-        name_uid = sql_cursor.fetchone()
-        if name_uid is None:
-            return False
-        self.name_uid_suffix = name_uid[0].split('|')[1]
-        name_uid = name_uid[0].split('|')[0]
+        name_uid, _, self.name_uid_suffix = result[0].partition('|')
         name = resolveLabel(self.sql_connection, name_uid)
 
         self.name_combobox.setName(name_uid, name)
 
-        for name, script in scripts.items():
-            decompiled_script = decompile(self.sql_connection, script)
+        for name, script in zip(self.code_box_names, result[1:]):
+            decompiled_script = decompile(self.sql_connection, str(script))
             self.code_boxes[name].replaceContent(decompiled_script)
             self.code_boxes[name].resetUndoHistory()
         self.current_npc_uid = npc_uid
@@ -1816,32 +2160,20 @@ class NPCEditorView:
             return False
 
         compiled_scripts = {}
-        for index, name in enumerate(self.code_box_names):
+        for name in self.code_box_names:
             success, compiled_script = \
                 compileAndShowErrorMessage(self.code_boxes[name].getContent())
             if success is False:
                 return False
             compiled_scripts[name] = compiled_script
-        sql_cursor = self.sql_connection.cursor()
-        sql_cursor.execute("""update _fb0x05 set
-            col_0_ForeignKey = ?,
-            col_2_String = ?,
-            col_3_String = ?,
-            col_1_String = ?,
-            col_5_String = ?,
-            col_4_String = ?
-            where UID = ?""", (
+        sql_cursor = getSharedCursor(self.sql_connection)
+        sql_cursor.execute(NPC_UPDATE_QUERY, (
             self.name_combobox.getUid() + '|' + self.name_uid_suffix,
-            compiled_scripts[self.code_box_names[0]],
-            compiled_scripts[self.code_box_names[1]],
-            compiled_scripts[self.code_box_names[2]],
-            compiled_scripts[self.code_box_names[3]],
-            compiled_scripts[self.code_box_names[4]],
+            *(compiled_scripts[name] for name in self.code_box_names),
             self.current_npc_uid,
         ))
 
-        for name in self.code_box_names:
-            raw_script = compiled_scripts[name]
+        for name, raw_script in compiled_scripts.items():
             reformated_script = decompile(self.sql_connection, raw_script)
             self.code_boxes[name].replaceContent(reformated_script)
 
@@ -1903,7 +2235,7 @@ class AddNPCEditorView:
                 name_uid = insertStringIntoDatabase(
                     self.sql_connection,
                     5,  # NPC string type
-                    self.string_dialog_box.get())
+                    name)
             else:
                 name = self.name_combobox.getName()
                 name_uid = self.name_combobox.getUid()
@@ -1911,11 +2243,8 @@ class AddNPCEditorView:
             npc_uid = generateRowUid(5)
             magic_suffix = '|0012F394'  # Extracted from game, unknown meaning
 
-            sql_cursor = self.sql_connection.cursor()
-            sql_cursor.execute("""insert into
-            _fb0x05 (UID, col_0_ForeignKey, col_1_String, col_2_String,
-                     col_3_String, col_4_String, col_5_String, col_6_String)
-            values (?, ?, ?, ?, ?, ?, ?, ?)""", [
+            sql_cursor = getSharedCursor(self.sql_connection)
+            sql_cursor.execute(NPC_INSERT_QUERY, [
                 npc_uid,
                 name_uid + magic_suffix,
                 '',  # Trigger script
@@ -1970,7 +2299,7 @@ class DeleteNPCEditorView:
     def setupEditForID(self, npc_uid):
         self.__fullReset()
 
-        sql_cursor = self.sql_connection.cursor()
+        sql_cursor = getSharedCursor(self.sql_connection)
         sql_cursor.execute(
             'select col_0_ForeignKey from _fb0x05 where UID = ?',
             [npc_uid])
@@ -1982,7 +2311,7 @@ class DeleteNPCEditorView:
             return False
 
         self.current_npc_uid = npc_uid
-        self.current_npc_string_uid = sql_result[0].split('|')[0]
+        self.current_npc_string_uid = sql_result[0].partition('|')[0]
 
         return True
 
@@ -1990,7 +2319,7 @@ class DeleteNPCEditorView:
         if self.current_npc_uid is None:
             return False
 
-        sql_cursor = self.sql_connection.cursor()
+        sql_cursor = getSharedCursor(self.sql_connection)
         sql_cursor.execute('delete from _fb0x05 where uid = ?',
                            [self.current_npc_uid])
 
@@ -2060,7 +2389,7 @@ class AddStringDialogView:
     def __saveAsDialogText(self):
         new_uid = generateRowUid(6)
 
-        sql_cursor = self.sql_connection.cursor()
+        sql_cursor = getSharedCursor(self.sql_connection)
         sql_cursor.execute("""insert into
             _fb0x06 (UID, col_0_String, col_1_Integer, col_2_String)
             values (?, ?, ?, ?)""", [
@@ -2120,7 +2449,7 @@ class DeleteStringDialogView:
         else:
             return False
 
-        sql_cursor = self.sql_connection.cursor()
+        sql_cursor = getSharedCursor(self.sql_connection)
         sql_cursor.execute('delete from ' + table + ' where uid = ?',
                            [self.current_entry_id])
         self.current_entry_id = None
@@ -2128,16 +2457,12 @@ class DeleteStringDialogView:
         return ('IntroductionFrame', '', '')
 
     def __isDeleteableString(self, string_uid):
-        sql_cursor = self.sql_connection.cursor()
-        sql_cursor.execute("""select 1 from _fb0x02
-        where UID = ? and (col_1_Integer == 5 or col_1_Integer is 10)
-        """, [string_uid])
-        return sql_cursor.fetchone() is not None
+        return string_uid in \
+            buildDeletableStringIndex(self.sql_connection)
 
     def __isDeleteableDialog(self, dialog_uid):
-        sql_cursor = self.sql_connection.cursor()
-        sql_cursor.execute('select 1 from _fb0x06 where UID = ?', [dialog_uid])
-        return sql_cursor.fetchone() is not None
+        return dialog_uid in buildStringIndex(self.sql_connection,
+                                              '_fb0x06')
 
 
 class EditorViewContainer:
@@ -2175,76 +2500,53 @@ class EditorViewContainer:
             fill=tk.BOTH, expand=True, side=tk.BOTTOM)
         self.current_frame_pair = self.intro_frame_pair
 
-        self.fairy_frame_pair = self.__WidgetFramePair(edit_frame)
-        self.fairy_frame_pair.widget = FairyEditorView(
-            self.fairy_frame_pair.frame, sql_connection)
-
-        self.string_frame_pair = self.__WidgetFramePair(edit_frame)
-        self.string_frame_pair.widget = StringDialogEditorView(
-            self.string_frame_pair.frame, sql_connection, '_fb0x02')
-
-        self.spell_frame_pair = self.__WidgetFramePair(edit_frame)
-        self.spell_frame_pair.widget = \
-            SpellEditorView(self.spell_frame_pair.frame, sql_connection)
-
-        self.item_frame_pair = self.__WidgetFramePair(edit_frame)
-        self.item_frame_pair.widget = \
-            ItemEditorView(self.item_frame_pair.frame, sql_connection)
-
-        self.npc_frame_pair = self.__WidgetFramePair(edit_frame)
-        self.npc_frame_pair.widget = \
-            NPCEditorView(self.npc_frame_pair.frame, sql_connection)
-
-        self.dialog_frame_pair = self.__WidgetFramePair(edit_frame)
-        self.dialog_frame_pair.widget = StringDialogEditorView(
-            self.dialog_frame_pair.frame, sql_connection, '_fb0x06')
-
-        self.add_text_frame_pair = self.__WidgetFramePair(edit_frame)
-        self.add_text_frame_pair.widget = AddStringDialogView(
-            self.add_text_frame_pair.frame, sql_connection)
-
-        self.delete_text_frame_pair = self.__WidgetFramePair(edit_frame)
-        self.delete_text_frame_pair.widget = DeleteStringDialogView(
-            self.delete_text_frame_pair.frame, sql_connection)
-
-        self.add_npc_pair = self.__WidgetFramePair(edit_frame)
-        self.add_npc_pair.widget = AddNPCEditorView(
-            self.add_npc_pair.frame, sql_connection)
-
-        self.delete_npc_pair = self.__WidgetFramePair(edit_frame)
-        self.delete_npc_pair.widget = DeleteNPCEditorView(
-            self.delete_npc_pair.frame, sql_connection)
-
-        self.frame_table = {
-            'IntroductionFrame': self.intro_frame_pair,
-            'Fairy': self.fairy_frame_pair,
-            'String': self.string_frame_pair,
-            'Spell': self.spell_frame_pair,
-            'Item': self.item_frame_pair,
-            'NPC': self.npc_frame_pair,
-            'Dialog': self.dialog_frame_pair,
-            'AddTextItem': self.add_text_frame_pair,
-            'DeleteTextItem': self.delete_text_frame_pair,
-            'AddNPC': self.add_npc_pair,
-            'DeleteNPC': self.delete_npc_pair,
+        self.edit_frame = edit_frame
+        self.editor_view_specs = {
+            'Fairy': [FairyEditorView],
+            'String': [StringDialogEditorView, '_fb0x02'],
+            'Spell': [SpellEditorView],
+            'Item': [ItemEditorView],
+            'NPC': [NPCEditorView],
+            'Dialog': [StringDialogEditorView, '_fb0x06'],
+            'AddTextItem': [AddStringDialogView],
+            'DeleteTextItem': [DeleteStringDialogView],
+            'AddNPC': [AddNPCEditorView],
+            'DeleteNPC': [DeleteNPCEditorView],
         }
+        self.frame_table = {'IntroductionFrame': self.intro_frame_pair}
 
         self.after_db_update_callback = None
 
     def canEdit(self, entry_type):
-        return entry_type in self.frame_table
+        return entry_type == 'IntroductionFrame' or \
+            entry_type in self.editor_view_specs
 
     def canDelete(self, entry_type, entry_id):
         if entry_type == 'Dialog' or entry_type == 'String':
-            return self.delete_text_frame_pair.widget.canDelete(entry_id)
+            return self.__getFramePair('DeleteTextItem') \
+                .widget.canDelete(entry_id)
         return entry_type == 'NPC'
 
+    def __getFramePair(self, entry_type):
+        """
+        Return the frame pair for the given entry type, building its
+        editor view on first use.
+        """
+        pair = self.frame_table.get(entry_type)
+        if pair is None:
+            view_class, *extra_args = self.editor_view_specs[entry_type]
+            pair = self.__WidgetFramePair(self.edit_frame)
+            pair.widget = view_class(pair.frame, self.sql_connection,
+                                     *extra_args)
+            self.frame_table[entry_type] = pair
+        return pair
+
     def startEditing(self, entry_type, entry_id, short_description=''):
         matching_editor_view = None
         if not self.canEdit(entry_type):
             return
 
-        matching_editor_view = self.frame_table[entry_type]
+        matching_editor_view = self.__getFramePair(entry_type)
         new_label_text = entry_type + '(' + entry_id + ') '
         new_label_text += short_description
 
@@ -2278,6 +2580,7 @@ class EditorViewContainer:
             return
 
         self.sql_connection.commit()
+        clearResolverCaches()
         if self.after_db_update_callback is not None:
             self.after_db_update_callback()
 
@@ -2321,7 +2624,14 @@ for "jump(*)"
 
 class SearchCache:
     def __init__(self):
-        self.cache = []
+        # Parallel lists: the search scan only touches search_strings,
+        # which keeps the hot loop on one contiguous list.
+        self.sort_keys = []  # Case-folded
+        self.displayed_texts = []
+        self.search_strings = []  # Case-folded
+        # Suggested in the right-click contextmenu in "Search for ..."
+        self.search_suggestions = []
+        self.trigram_index = None
 
     def appendToIndex(self, sort_key, displayed_text, search_suggestion,
                       extra_info=''):
@@ -2329,14 +2639,14 @@ class SearchCache:
         The given extra_info is not displayed, but matched against substrings
         during searches.
         """
-        string_to_search = sort_key.casefold() + displayed_text.casefold() + \
-            extra_info.casefold()
-        self.cache.append(self.__IndexedItem(
-            sort_key.casefold(),
-            displayed_text.replace('\n', ' '),
-            makeStringSearchable(string_to_search),
-            search_suggestion,
-        ))
+        sort_key = sort_key.casefold()
+        string_to_search = \
+            sort_key + (displayed_text + extra_info).casefold()
+        self.sort_keys.append(sort_key)
+        self.displayed_texts.append(displayed_text.replace('\n', ' '))
+        self.search_strings.append(makeStringSearchable(string_to_search))
+        self.search_suggestions.append(search_suggestion)
+        self.trigram_index = None
 
     def searchSubstrings(self, substring_list):
         """
@@ -2347,34 +2657,77 @@ class SearchCache:
         The returned result contains a list of pairs in the order they got
         inserted, example: [['displayed_text', 'search_suggestion'], ...]
         """
-        matches = self.cache
-        substring_list = [s.casefold() for s in substring_list]
-        for substring in substring_list:
-            matches = [
-                item for item in matches if substring in item.string_to_search
-            ]
+        # Longest substrings first: they reject non-matching items with
+        # the fewest checks.
+        substring_list = sorted((s.casefold() for s in substring_list),
+                                key=len, reverse=True)
+        search_strings = self.search_strings
         return [
-            [item.displayed_text, item.search_suggestion] for item in matches
+            [self.displayed_texts[item_number],
+             self.search_suggestions[item_number]]
+            for item_number in self.__findCandidates(substring_list)
+            if all(substring in search_strings[item_number]
+                   for substring in substring_list)
         ]
 
+    def __findCandidates(self, substring_list):
+        """
+        Narrow the full cache down to the indices of items containing
+        every trigram of every given substring. Substrings shorter than
+        three characters can't prune anything and get verified by the
+        caller.
+        """
+        if self.trigram_index is None:
+            self.__buildTrigramIndex()
+        candidates = None
+        for substring in substring_list:
+            for position in range(len(substring) - 2):
+                posting = self.trigram_index.get(
+                    substring[position:position + 3])
+                if posting is None:
+                    return []
+                candidates = posting if candidates is None \
+                    else candidates & posting
+        if candidates is None:
+            return range(len(self.search_strings))
+        return sorted(candidates)
+
+    def __buildTrigramIndex(self):
+        index = {}
+        for item_number, string in enumerate(self.search_strings):
+            for position in range(len(string) - 2):
+                index.setdefault(string[position:position + 3],
+                                 set()).add(item_number)
+        self.trigram_index = index
+
     def reset(self):
-        self.cache = []
+        self.sort_keys = []
+        self.displayed_texts = []
+        self.search_strings = []
+        self.search_suggestions = []
+        self.trigram_index = None
 
     def sort(self):
-        self.cache.sort(key=lambda item: item.sort_key)
+        order = sorted(range(len(self.sort_keys)),
+                       key=self.sort_keys.__getitem__)
+        self.sort_keys = [self.sort_keys[i] for i in order]
+        self.displayed_texts = [self.displayed_texts[i] for i in order]
+        self.search_strings = [self.search_strings[i] for i in order]
+        self.search_suggestions = \
+            [self.search_suggestions[i] for i in order]
+        self.trigram_index = None
 
     def appendOtherCache(self, other_cache):
-        self.cache += other_cache.cache
-
-    @dataclass
-    class __IndexedItem:
-        # Case-folded
-        sort_key: str
-        displayed_text: str
-        # Case-folded
-        string_to_search: str
-        # Suggested in the right-click contextmenu in "Search for ..."
-        search_suggestion: str
+        self.sort_keys += other_cache.sort_keys
+        self.displayed_texts += other_cache.displayed_texts
+        self.search_strings += other_cache.search_strings
+        self.search_suggestions += other_cache.search_suggestions
+        self.trigram_index = None
+
+
+# Worker thread for rebuilding the search cache without freezing the
+# Tk main loop. A single worker keeps rebuilds in submission order.
+REBUILD_EXECUTOR = concurrent.futures.ThreadPoolExecutor(max_workers=1)
 
 
 class DBSearchView:
@@ -2397,9 +2750,10 @@ class DBSearchView:
         search_label = tk.Label(top_frame, text='Search (Control + L)')
         search_label.grid(row=0, column=0, sticky='WE')
         self.filter_input_string = tk.StringVar()
+        self.search_after_id = None
         self.filter_input_string \
             .trace_add('write', lambda ignore1, ignore2, ignore3:
-                       self.refreshSearch(self.filter_input_string.get()))
+                       self.__scheduleRefreshSearch())
         self.filter_input_box = tk.Entry(
             top_frame, textvariable=self.filter_input_string)
         self.filter_input_box.grid(row=0, column=1, sticky='WE')
@@ -2413,6 +2767,11 @@ class DBSearchView:
         self.text_box.bind('<Button-3>', self.openContextMenu)
 
         self.db_cache = SearchCache()
+        self.rebuild_connection = None
+        self.latest_reload_future = None
+        self.last_search_query = None
+        self.last_search_results = []
+        self.last_rendered_text = ''
         self.reloadDB()
 
     def focusSearchBox(self):
@@ -2424,116 +2783,119 @@ class DBSearchView:
         Return a ColorDelegator for syntax highlighting db content.
         """
         delegator = colorizer.ColorDelegator()
-        delegator.tagdefs['HIGHLIGHTED'] = {
-            'foreground': '#cdcecf', 'background': '#3c5372'
-        }
-        delegator.tagdefs['TRUNCATED'] = {'foreground': '#c94f6d'}
-        delegator.tagdefs['TYPE'] = {'foreground': '#9d79d6'}
-        delegator.tagdefs['UID'] = {'foreground': '#86abdc'}
-        delegator.tagdefs['CLOSINGPAREN'] = delegator.tagdefs['TYPE']
-        delegator.tagdefs['SLOTSSTART'] = {'foreground': '#f6b079'}
-        delegator.tagdefs['SLOTS'] = {'foreground': '#dbc074'}
-        delegator.tagdefs['SLOTSEND'] = delegator.tagdefs['SLOTSSTART']
-        delegator.tagdefs['ATTRIBSTART'] = delegator.tagdefs['SLOTSSTART']
-        delegator.tagdefs['ATTRIBVARS'] = delegator.tagdefs['SLOTS']
-        delegator.tagdefs['ATTRIBEND'] = delegator.tagdefs['ATTRIBSTART']
+        delegator.tagdefs.update(SEARCH_HIGHLIGHT_TAGDEFS)
         addDialogHighlightGroups(delegator.tagdefs)
         return delegator
 
-    def rebuildDBCache(self):
-        self.db_cache.reset()
-        sql_cursor = self.sql_connection.cursor()
+    def rebuildDBCache(self, sql_connection):
+        """
+        Builds and returns a fresh SearchCache from the given
+        connection. Runs on the rebuild worker thread, so it must not
+        touch Tk or mutate view state.
+        """
+        db_cache = SearchCache()
+        # Needs its own cursor: the row loops below iterate lazily while
+        # nested helpers run queries on the shared cursor.
+        sql_cursor = sql_connection.cursor()
+        sql_cursor.arraysize = 1000  # Rows per internal fetch batch.
+
+        # Bind hot lookups to locals for faster access in the loops below.
+        append_to_index = db_cache.appendToIndex
+        resolve_element_class = self.__resolveElementClass
+        to_stat_string = toStatString
+        get_card_entity_id = getCardEntityId
 
         # Strings
         sql_cursor.execute('select UID, col_0_String from _fb0x02')
-        for uid, string in sql_cursor.fetchall():
-            self.db_cache.appendToIndex(
-                string, 'String(' + uid + ') ' + string, uid
+        for uid, string in sql_cursor:
+            append_to_index(
+                string, f'String({uid}) {string}', uid
             )
 
-        # Fairies
-        sql_cursor.execute("""select col_0_String, col_1_ForeignKey,
-        col_2_Integer, col_3_Integer, col_15_ForeignKey, col_16_Integer,
-        col_17_Integer, col_18_Integer, col_19_Integer, col_20_Integer,
-        col_21_Integer, col_23_Integer from _fb0x01""")
-        for model_uid, name_uid, element_class, card_id, info_uid, hp, \
-                evolution_id, evolution_level, speed, jump_ability, special, \
-                glow_id in sql_cursor.fetchall():
-            name_uid = name_uid.split('|')[0]
-            name = resolveLabel(self.sql_connection, name_uid)
+        # Fairies. Names get resolved inside the statement to keep the
+        # per-row Python work small.
+        fairy_name_uid = buildSuffixStripSQL('f.col_1_ForeignKey')
+        sql_cursor.execute(f"""select f.col_0_String, {fairy_name_uid},
+        ifnull(n.col_0_String, 'NULL'), f.col_2_Integer, f.col_3_Integer,
+        f.col_15_ForeignKey, f.col_16_Integer, f.col_17_Integer,
+        f.col_18_Integer, f.col_19_Integer, f.col_20_Integer,
+        f.col_21_Integer, f.col_23_Integer from _fb0x01 f
+        left join _fb0x02 n on n.UID = {fairy_name_uid}""")
+        for model_uid, name_uid, name, element_class, card_id, info_uid, \
+                hp, evolution_id, evolution_level, speed, jump_ability, \
+                special, glow_id in sql_cursor:
             evolution_info = NONE_STRING
             if evolution_id != -1:
-                evolution_name = resolveFairyName(self.sql_connection,
+                evolution_name = resolveFairyName(sql_connection,
                                                   evolution_id)
-                evolution_info = str(evolution_level) + ' -> ' + evolution_name
-            glow_text = ''
-            if glow_id >= 0 and glow_id < len(FAIRY_GLOWS_WITH_INTENSITY):
-                glow_text = FAIRY_GLOWS_WITH_INTENSITY[glow_id][0]
+                evolution_info = f'{evolution_level} -> {evolution_name}'
+            glow_text = FAIRY_GLOW_TEXT_BY_INDEX.get(glow_id, '')
             displayed_text = \
-                'Fairy(' + str(getCardEntityId(card_id)) + ') ' + \
-                name + \
-                ' [' + self.__resolveElementClass(element_class) + ']' + \
-                ' MaxHP(' + str(hp) + ')' + \
-                ' Speed(' + toStatString(speed) + ')' + \
-                ' Jump(' + toStatString(jump_ability) + ')' + \
-                ' Special(' + toStatString(special) + ')' + \
-                ' Evolution(' + evolution_info + ')' + \
-                ' Model(' + model_uid + ')'
-            self.db_cache.appendToIndex(
+                f'Fairy({get_card_entity_id(card_id)}) {name}' \
+                f' [{resolve_element_class(element_class)}]' \
+                f' MaxHP({hp})' \
+                f' Speed({to_stat_string(speed)})' \
+                f' Jump({to_stat_string(jump_ability)})' \
+                f' Special({to_stat_string(special)})' \
+                f' Evolution({evolution_info})' \
+                f' Model({model_uid})'
+            append_to_index(
                 name, displayed_text,
                 name, name_uid + info_uid + glow_text,
             )
 
         # Spells
-        sql_cursor.execute("""select col_0_ForeignKey, col_1_Integer,
-        col_2_Integer, col_3_Byte, col_4_Byte, col_5_Byte, col_6_ForeignKey,
-        col_7_Integer, col_8_Integer, col_12_Integer, col_13_Integer
-        from _fb0x03""")
-        for name_uid, is_passive, card_id, slot_0, slot_1, slot_2, \
-                info_uid, mana, cast_speed, damage, spell_effect \
-                in sql_cursor.fetchall():
-            name_uid = name_uid.split('|')[0]
-            info_uid = info_uid.split('|')[0]
-            name = resolveLabel(self.sql_connection, name_uid)
-            spell_type = 'passive' if str(is_passive) == '1' else 'active'
-            slots = [self.__resolveElementClass(slot_0),
-                     self.__resolveElementClass(slot_1),
-                     self.__resolveElementClass(slot_2)]
-            slots = [s for s in slots if NONE_STRING not in s]
+        spell_name_uid = buildSuffixStripSQL('s.col_0_ForeignKey')
+        spell_info_uid = buildSuffixStripSQL('s.col_6_ForeignKey')
+        sql_cursor.execute(f"""select {spell_name_uid},
+        ifnull(n.col_0_String, 'NULL'), s.col_1_Integer, s.col_2_Integer,
+        s.col_3_Byte, s.col_4_Byte, s.col_5_Byte, {spell_info_uid},
+        ifnull(i.col_0_String, 'NULL'), s.col_7_Integer, s.col_8_Integer,
+        s.col_12_Integer, s.col_13_Integer from _fb0x03 s
+        left join _fb0x02 n on n.UID = {spell_name_uid}
+        left join _fb0x02 i on i.UID = {spell_info_uid}""")
+        for name_uid, name, is_passive, card_id, slot_0, slot_1, slot_2, \
+                info_uid, info, mana, cast_speed, damage, spell_effect \
+                in sql_cursor:
+            # Tolerates both int and text affinity for the flag column.
+            is_passive_flag = is_passive in (1, '1')
+            spell_type = 'passive' if is_passive_flag else 'active'
+            # Id 0 is the none class; compare ids directly and resolve
+            # names only for the remaining slots.
+            slots = [resolve_element_class(id)
+                     for id in (slot_0, slot_1, slot_2) if id != 0]
             if len(slots) == 0:
                 slots = [ELEMENT_CLASSES[0]]
             displayed_text = \
-                'Spell(' + str(getCardEntityId(card_id)) + \
-                ', ' + spell_type + ') ' + name + \
-                ' [' + ', '.join(slots) + ']' + \
-                ' Damage(' + toStatString(damage) + ')' + \
-                ' Speed(' + toStatString(cast_speed) + ')' + \
-                ' Mana(' + resolveMana(mana) + ')' + \
-                ' ' + resolveLabel(self.sql_connection, info_uid)
-
-            effect_description = ''
-            effect_description_list = \
-                PASSIVE_SPELL_EFFECTS if str(is_passive) == '1' \
-                else ACTIVE_SPELL_CRIT_EFFECTS
-            if spell_effect >= 0 and \
-                    spell_effect < len(effect_description_list):
-                effect_description = effect_description_list[spell_effect]
-            self.db_cache.appendToIndex(
+                f'Spell({get_card_entity_id(card_id)}, {spell_type}) {name}' \
+                f' [{", ".join(slots)}]' \
+                f' Damage({to_stat_string(damage)})' \
+                f' Speed({to_stat_string(cast_speed)})' \
+                f' Mana({resolveMana(mana)})' \
+                f' {info}'
+
+            effect_descriptions = \
+                PASSIVE_SPELL_EFFECT_BY_INDEX if is_passive_flag \
+                else ACTIVE_SPELL_CRIT_EFFECT_BY_INDEX
+            effect_description = effect_descriptions.get(spell_effect, '')
+            append_to_index(
                 name, displayed_text, name,
                 name_uid + info_uid + effect_description)
 
         # Items
-        sql_cursor.execute("""select col_0_ForeignKey, col_1_Integer,
-        col_2_ForeignKey, col_4_String from _fb0x04""")
-        for name_uid, card_id, info_uid, script in sql_cursor.fetchall():
-            name_uid = name_uid.split('|')[0]
-            info_uid = info_uid.split('|')[0]
-            name = resolveLabel(self.sql_connection, name_uid)
-            decompiled_script = decompile(self.sql_connection, str(script))
+        item_name_uid = buildSuffixStripSQL('t.col_0_ForeignKey')
+        item_info_uid = buildSuffixStripSQL('t.col_2_ForeignKey')
+        sql_cursor.execute(f"""select {item_name_uid},
+        ifnull(n.col_0_String, 'NULL'), t.col_1_Integer, {item_info_uid},
+        ifnull(i.col_0_String, 'NULL'), t.col_4_String from _fb0x04 t
+        left join _fb0x02 n on n.UID = {item_name_uid}
+        left join _fb0x02 i on i.UID = {item_info_uid}""")
+        for name_uid, name, card_id, info_uid, info, script in sql_cursor:
+            decompiled_script = decompile(sql_connection, str(script))
             displayed_text = \
-                'Item(' + str(getCardEntityId(card_id)) + ') ' + name + \
-                ' -- ' + resolveLabel(self.sql_connection, info_uid)
-            self.db_cache.appendToIndex(
+                f'Item({get_card_entity_id(card_id)}) {name}' \
+                f' -- {info}'
+            append_to_index(
                 name,
                 displayed_text,
                 name,
@@ -2542,10 +2904,10 @@ class DBSearchView:
 
         # Dialogs
         sql_cursor.execute('select UID, col_0_String from _fb0x06')
-        for uid, dialog_text in sql_cursor.fetchall():
-            self.db_cache.appendToIndex(
+        for uid, dialog_text in sql_cursor:
+            append_to_index(
                 str(dialog_text),
-                'Dialog(' + uid + ') ' + str(dialog_text),
+                f'Dialog({uid}) {dialog_text}',
                 uid
             )
 
@@ -2555,34 +2917,37 @@ class DBSearchView:
             if command in script_command_parameters:
                 parameters = script_command_parameters[command]
                 displayed_text += ' ' + ', '.join(parameters)
-            self.db_cache.appendToIndex(
+            append_to_index(
                 command,
                 displayed_text,
                 command
             )
 
-        self.db_cache.sort()
+        db_cache.sort()
 
         # Append NPCs last to cleanup presented results.
         npc_cache = SearchCache()
-        sql_cursor.execute('select UID, col_0_ForeignKey from _fb0x05')
-        for uid, name_uid in sql_cursor.fetchall():
-            name_uid = name_uid.split('|')[0]
-            name = resolveLabel(self.sql_connection, name_uid)
-            scripts = fetchAllNpcScripts(self.sql_connection, uid).values()
+        append_to_npc_index = npc_cache.appendToIndex
+        npc_name_uid = buildSuffixStripSQL('p.col_0_ForeignKey')
+        sql_cursor.execute(f"""select p.UID, {npc_name_uid},
+        ifnull(n.col_0_String, 'NULL'), p.col_1_String, p.col_2_String,
+        p.col_3_String, p.col_4_String, p.col_5_String from _fb0x05 p
+        left join _fb0x02 n on n.UID = {npc_name_uid}""")
+        for uid, name_uid, name, *scripts in sql_cursor:
             decompiled_scripts = [
-                decompile(self.sql_connection, str(s)) for s in scripts
+                decompile(sql_connection, str(s)) for s in scripts
             ]
 
-            npc_cache.appendToIndex(
+            append_to_npc_index(
                 name,
-                'NPC(' + uid + ') ' + name,
+                f'NPC({uid}) {name}',
                 name,
                 name_uid + ''.join(decompiled_scripts) +
-                self.__toRawIntString(uid),
+                toRawIntString(uid),
             )
         npc_cache.sort()
-        self.db_cache.appendOtherCache(npc_cache)
+        db_cache.appendOtherCache(npc_cache)
+        return db_cache
 
     def searchDBCache(self, search_query):
         """
@@ -2592,17 +2957,39 @@ class DBSearchView:
         """
         return self.db_cache.searchSubstrings(splitByWhitespace(search_query))
 
+    def __scheduleRefreshSearch(self):
+        """
+        Rescan the cache at most once per typing burst instead of on
+        every keystroke.
+        """
+        if self.search_after_id is not None:
+            self.parent_frame.after_cancel(self.search_after_id)
+        self.search_after_id = self.parent_frame.after(
+            120, self.__runScheduledSearch)
+
+    def __runScheduledSearch(self):
+        self.search_after_id = None
+        self.refreshSearch(self.filter_input_string.get())
+
     def refreshSearch(self, search_query):
         found_results = self.searchDBCache(search_query)
-        text_box_content = \
-            found_results[0][0] if len(found_results) > 0 else ''
-        for line, _ in islice(found_results, 1, None):
-            text_box_content += '\n' + line
-            if len(text_box_content) > 15000:
-                text_box_content += '\n...truncated, too many results'
+        self.last_search_query = search_query
+        self.last_search_results = found_results
+        lines = []
+        content_length = -1  # Compensates for the missing first newline.
+        for line, _ in found_results:
+            lines.append(line)
+            content_length += len(line) + 1
+            if content_length > 15000:
+                lines.append('...truncated, too many results')
                 break
+        text_box_content = '\n'.join(lines)
 
-        if self.text_box.get('1.0', 'end-1c') != text_box_content:
+        # The box is kept disabled, so its content is always whatever
+        # the previous refresh rendered - no need to read it back from
+        # Tk for the comparison.
+        if self.last_rendered_text != text_box_content:
+            self.last_rendered_text = text_box_content
             self.text_box['state'] = 'normal'
             self.text_box.delete('1.0', 'end')
             self.text_box.insert(tk.END, text_box_content)
@@ -2610,26 +2997,21 @@ class DBSearchView:
         else:
             self.delegator.notify_range('1.0', tk.END)
 
-        regex = r'(?P<TRUNCATED>(^|\n)\.\.\.truncated.*$)' + \
-                r'|(^|\n)(?P<TYPE>(Command|Dialog|Fairy|Item|NPC|' + \
-                r'Spell|String)\()(?P<UID>[^\)]+)(?P<CLOSINGPAREN>\))' + \
-                r'|(?P<SLOTSSTART>\[)(?P<SLOTS>[^\]]+)(?P<SLOTSEND>\])' + \
-                r'|(?P<ATTRIBSTART> (Mana|Speed|Damage|Model|MaxHP|Speed' + \
-                r'|Jump|Special|Evolution)\()(?P<ATTRIBVARS>[^\)]+)' + \
-                r'(?P<ATTRIBEND>\))|' + DIALOG_HIGHLIGHT_REGEX
-
         search_strings = splitByWhitespace(self.filter_input_string.get())
-        if len(search_strings) > 0:
-            regex += r'|(?P<HIGHLIGHTED>('
-            regex += '|'.join([re.escape(s) for s in search_strings])
-            regex += r'))'
-        self.delegator.prog = re.compile(regex, re.IGNORECASE)
+        self.delegator.prog = \
+            buildSearchHighlightPattern(tuple(search_strings))
 
     def openContextMenu(self, event):
         line, column = [
             int(s) for s in self.text_box.index(tk.CURRENT).split('.')
         ]
-        search_results = self.searchDBCache(self.filter_input_string.get())
+        # The displayed results are still those of the last refresh, so
+        # only rerun the search if a refresh is pending.
+        search_query = self.filter_input_string.get()
+        if search_query == self.last_search_query:
+            search_results = self.last_search_results
+        else:
+            search_results = self.searchDBCache(search_query)
 
         self.context_menu.delete(0, 'end')
         if line > len(search_results):
@@ -2660,7 +3042,7 @@ class DBSearchView:
                 self.context_menu.add_command(
                     label='Copy UID as Raw Integer',
                     command=lambda:
-                    self.__copyToClipboard(self.__toRawIntString(entry_id)))
+                    self.__copyToClipboard(toRawIntString(entry_id)))
 
         if self.editor_view.canDelete(entry_type, entry_id):
             command = 'DeleteNPC' if entry_type == 'NPC' else 'DeleteTextItem'
@@ -2684,16 +3066,77 @@ class DBSearchView:
         self.context_menu.tk_popup(event.x_root, event.y_root)
 
     def reloadDB(self):
-        self.rebuildDBCache()
+        """
+        Rebuilds the search cache on the worker thread while searches
+        keep running on the old cache. Falls back to a synchronous
+        rebuild if the database has no backing file to open a second
+        connection on.
+        """
+        rebuild_connection = self.__getRebuildConnection()
+        if rebuild_connection is None:
+            self.db_cache = \
+                self.__rebuildDBCacheInTransaction(self.sql_connection)
+            self.refreshSearch(self.filter_input_string.get())
+            return
+
+        future = REBUILD_EXECUTOR.submit(
+            self.__rebuildDBCacheInTransaction, rebuild_connection)
+        self.latest_reload_future = future
+        future.add_done_callback(
+            lambda future:
+            self.text_box.after(0, self.__finishReload, future))
+
+    def __finishReload(self, future):
+        if future is not self.latest_reload_future:
+            return  # A newer rebuild is already underway.
+        self.db_cache = future.result()
         self.refreshSearch(self.filter_input_string.get())
 
-    def __resolveElementClass(self, id):
-        if id < 0 or id >= len(ELEMENT_CLASSES):
-            return 'NULL'
-        return ELEMENT_CLASSES[id]
+    def __rebuildDBCacheInTransaction(self, sql_connection):
+        """
+        Runs rebuildDBCache inside a single deferred transaction, so
+        sqlite takes one read snapshot for all rebuild queries instead
+        of re-acquiring locks per statement.
+        """
+        if sql_connection.in_transaction:
+            return self.rebuildDBCache(sql_connection)
+        sql_connection.execute('begin')
+        # A rebuild which was already running when the last commit
+        # cleared the resolver caches may have repopulated them from
+        # its older snapshot. Drop them again now that this rebuild's
+        # snapshot is pinned, so it only sees entries computed from
+        # its own snapshot.
+        clearResolverCaches()
+        try:
+            return self.rebuildDBCache(sql_connection)
+        finally:
+            # The rebuild only reads, so there is nothing to commit.
+            sql_connection.rollback()
+
+    def __getRebuildConnection(self):
+        if self.rebuild_connection is not None:
+            return self.rebuild_connection
+        for _, name, filename in \
+                self.sql_connection.execute('pragma database_list'):
+            if name == 'main' and filename:
+                # check_same_thread is off because the connection gets
+                # opened here but is only ever used by the worker.
+                self.rebuild_connection = sqlite3.connect(
+                    filename, cached_statements=512,
+                    check_same_thread=False)
+                self.rebuild_connection.execute(
+                    'pragma temp_store = MEMORY')
+                self.rebuild_connection.execute(
+                    'pragma cache_size = -65536')  # 64 MiB
+                self.rebuild_connection.execute(
+                    'pragma mmap_size = 268435456')  # 256 MiB
+                # The worker only ever reads.
+                self.rebuild_connection.execute('pragma query_only = 1')
+                break
+        return self.rebuild_connection
 
-    def __toRawIntString(self, uid_string):
-        return str(int(uid_string, 16))
+    def __resolveElementClass(self, id):
+        return ELEMENT_CLASS_BY_INDEX.get(id, 'NULL')
 
     def __copyToClipboard(self, string):
         self.parent_frame.clipboard_clear()
@@ -2739,7 +3182,13 @@ paned_window.add(left_frame, weight=1)
 paned_window.add(right_frame, weight=1)
 paned_window.pack(fill=tk.BOTH, expand=True)
 
-with sqlite3.connect(db_path) as sql_connection:
+with sqlite3.connect(db_path, cached_statements=512) as sql_connection:
+    sql_connection.execute('pragma journal_mode = WAL')
+    sql_connection.execute('pragma synchronous = NORMAL')
+    sql_connection.execute('pragma temp_store = MEMORY')
+    sql_connection.execute('pragma cache_size = -65536')  # 64 MiB
+    sql_connection.execute('pragma mmap_size = 268435456')  # 256 MiB
+
     editor_view = EditorViewContainer(right_frame, sql_connection)
     db_search = DBSearchView(left_frame, sql_connection, editor_view)
 